@@ -16,6 +16,7 @@
 
 import abc
 import logging
+from itertools import islice
 from pathlib import Path
 
 _logger = logging.getLogger(__name__)
@@ -129,7 +130,8 @@ class DataProcessor(metaclass=abc.ABCMeta):
         Returns:
             file_path (str): Actual path to the file of interest.
         """
-        file_list = list(base_dir_file.glob(self.file_name_identifier))
+        # two matches suffice to decide on uniqueness, so the directory scan can stop early
+        file_list = list(islice(base_dir_file.glob(self.file_name_identifier), 2))
 
         if len(file_list) > 1:
             raise RuntimeError(
@@ -193,6 +195,10 @@ class DataProcessor(metaclass=abc.ABCMeta):
             base_dir_file (Path): Path of the base directory that
                                     contains the file of interest.
         """
-        for regex in self.files_to_be_deleted_regex_lst:
-            for file in sorted(base_dir_file.glob(regex)):
-                file.unlink(missing_ok=True)
+        files_to_be_deleted = {
+            file
+            for regex in self.files_to_be_deleted_regex_lst
+            for file in base_dir_file.glob(regex)
+        }
+        for file in files_to_be_deleted:
+            file.unlink(missing_ok=True)
@@ -15,6 +15,7 @@
 """Data processor class for csv data extraction."""
 
 import logging
+from itertools import islice
 
 import numpy as np
 import pandas as pd
@@ -246,12 +247,11 @@ class DataProcessorCsv(DataProcessor):
         try:
             raw_data = pd.read_csv(
                 file_path,
-                sep=r",|\s+",
                 usecols=self.use_cols_lst,
                 skiprows=self.skip_rows,
                 header=self.header_row,
-                engine="python",
                 index_col=self.index_column,
+                **self._separator_options(file_path),
             )
             _logger.info("Successfully read-in data from %s.", file_path)
             return raw_data
@@ -264,6 +264,25 @@ class DataProcessorCsv(DataProcessor):
             )
             return None
 
+    def _separator_options(self, file_path):
+        """Get the separator options for reading the file.
+
+        Purely whitespace-separated files are read with the fast C engine of
+        pandas. Only if commas occur in the lines to be read, the slower
+        python engine with a regex separator is used.
+
+        Args:
+            file_path (str): Actual path to the file of interest.
+
+        Returns:
+            dict: Keyword arguments for the separator of *pd.read_csv*.
+        """
+        with open(file_path, encoding="utf-8") as csv_file:
+            has_commas = any("," in line for line in islice(csv_file, self.skip_rows, None))
+        if has_commas:
+            return {"sep": r",|\s+", "engine": "python"}
+        return {"sep": r"\s+"}
+
     def filter_and_manipulate_raw_data(self, raw_data):
         """Filter the pandas data-frame based on filter type.
 
@@ -452,14 +452,14 @@ class DataProcessorEnsightInterfaceDiscrepancy(DataProcessor):
         times_iter = time_steps_in_ensight.NewIterator()
         times_iter.GoToFirstItem()
 
-        steps = np.array([])
+        steps = []
 
         while not times_iter.IsDoneWithTraversal():
             curr = times_iter.GetCurrentObject()
-            steps = np.append(steps, vtk_to_numpy(curr))
+            steps.append(vtk_to_numpy(curr))
             times_iter.GoToNextItem()
 
-        steps = np.unique(steps)
+        steps = np.unique(np.concatenate(steps)) if steps else np.array([])
         idx = np.where(abs(steps - time) < self.time_tol)
         ensight_time = steps[idx]
 
@@ -27,6 +27,28 @@ from queens.utils.run_subprocess import run_subprocess
 _logger = logging.getLogger(__name__)
 
 
+def _run_git_command(*git_arguments):
+    """Run a git command in the QUEENS repository without a shell.
+
+    Args:
+        git_arguments (str): Arguments passed to git
+
+    Returns:
+        return_code (int): Return code of git
+        stdout (str): Standard output of git
+        stderr (str): Standard error of git
+    """
+    try:
+        return_code, _, stdout, stderr = run_subprocess(
+            ["git", "-C", str(PATH_TO_QUEENS), *git_arguments],
+            raise_error_on_subprocess_failure=False,
+        )
+    except FileNotFoundError as error:
+        # without a shell a missing git executable raises instead of returning an error code
+        return 1, "", str(error)
+    return return_code, stdout, stderr
+
+
 class GlobalSettings:
     """Class for global settings in Queens.
 
@@ -61,10 +83,7 @@ class GlobalSettings:
         log_file_path = self.result_file(".log")
         setup_basic_logging(log_file_path=log_file_path, debug=self.debug)
 
-        return_code, _, stdout, stderr = run_subprocess(
-            " ".join(["cd", f"{PATH_TO_QUEENS}", ";", "git", "rev-parse", "HEAD"]),
-            raise_error_on_subprocess_failure=False,
-        )
+        return_code, stdout, stderr = _run_git_command("rev-parse", "HEAD")
         if not return_code:
             git_hash = stdout.strip()
         else:
@@ -73,10 +92,7 @@ class GlobalSettings:
             _logger.warning(str(stderr))
             _logger.warning("Setting git hash to: %s!", git_hash)
 
-        return_code, _, git_branch, stderr = run_subprocess(
-            " ".join(["cd", f"{PATH_TO_QUEENS}", ";", "git", "rev-parse", "--abbrev-ref", "HEAD"]),
-            raise_error_on_subprocess_failure=False,
-        )
+        return_code, git_branch, stderr = _run_git_command("rev-parse", "--abbrev-ref", "HEAD")
         git_branch = git_branch.strip()
         if return_code:
             git_branch = "unknown"
@@ -84,10 +100,7 @@ class GlobalSettings:
             _logger.warning(str(stderr))
             _logger.warning("Setting git branch to: %s!", git_branch)
 
-        return_code, _, git_status, stderr = run_subprocess(
-            " ".join(["cd", f"{PATH_TO_QUEENS}", ";", "git", "status", "--porcelain"]),
-            raise_error_on_subprocess_failure=False,
-        )
+        return_code, git_status, stderr = _run_git_command("status", "--porcelain")
         git_clean_working_tree = not git_status
         if return_code:
             git_clean_working_tree = "unknown"
@@ -14,8 +14,14 @@
 #
 """Interface for grouping outputs with inputs."""
 
+import logging
+
+import numpy as np
+
 from queens.utils.logger_settings import log_init_args
 
+_logger = logging.getLogger(__name__)
+
 # pylint: disable=invalid-name
 
 
@@ -31,6 +37,8 @@ class BmfmcInterface:
         probabilistic_mapping (obj): Instance of the probabilistic mapping, which models the
                                      probabilistic dependency between high-fidelity model,
                                      low-fidelity models and informative input features.
+        training_data (tuple): Training inputs and outputs the probabilistic mapping was last
+                               trained on. Used to skip redundant re-training on identical data.
 
     Returns:
         BMFMCInterface (obj): Instance of the BMFMCInterface
@@ -46,6 +54,7 @@ class BmfmcInterface:
                                          low-fidelity models and informative input features.
         """
         self.probabilistic_mapping = probabilistic_mapping
+        self.training_data = None
 
     def evaluate(self, samples, support="y", full_cov=False, gradient_bool=False):
         r"""Predict on probabilistic mapping.
@@ -91,11 +100,21 @@ class BmfmcInterface:
         r"""Build and train the probabilistic mapping.
 
         Based on the training inputs
-        :math:`\mathcal{D}_f={Y_{HF},Z_{LF}}`.
+        :math:`\mathcal{D}_f={Y_{HF},Z_{LF}}`. If the probabilistic mapping was already trained
+        on an identical data set, the (expensive) training is skipped and the trained mapping is
+        reused.
 
         Args:
             Z_LF_train (np.array): Training inputs for probabilistic mapping
             Y_HF_train (np.array): Training outputs for probabilistic mapping
         """
+        if self.training_data is not None and all(
+            np.array_equal(new_data, old_data)
+            for new_data, old_data in zip((Z_LF_train, Y_HF_train), self.training_data)
+        ):
+            _logger.info("Probabilistic mapping is already trained on this data. Skip training.")
+            return
+
         self.probabilistic_mapping.setup(Z_LF_train, Y_HF_train)
         self.probabilistic_mapping.train()
+        self.training_data = (np.copy(Z_LF_train), np.copy(Y_HF_train))
@@ -355,11 +355,7 @@ class BMFIAIterator(Iterator):
             assert (
                 gamma_mat.shape[0] == y_lf_mat.shape[0]
             ), "Dimensions of gamma_mat and y_lf_mat do not agree! Abort..."
-            z_lst = []
-            for y_per_coordinate in y_lf_mat.T:
-                z_lst.append(np.hstack([y_per_coordinate.reshape(-1, 1), gamma_mat]))
-
-            z_mat = np.array(z_lst).squeeze().T
+            z_mat = self._stack_with_features(y_lf_mat, gamma_mat)
 
             assert z_mat.ndim == 3, "z_mat should be a 3d tensor if man features are used! Abort..."
 
@@ -371,6 +367,30 @@ class BMFIAIterator(Iterator):
 
         return z_mat
 
+    @staticmethod
+    def _stack_with_features(y_lf_mat, feature_mat):
+        """Stack every low-fidelity output dimension with the same features.
+
+        Args:
+            y_lf_mat (np.array): Low-fidelity output matrix with row-wise model realizations.
+                                 Columns are different dimensions of the output.
+            feature_mat (np.array): Feature matrix with row-wise data points and column-wise
+                                    feature dimensions.
+
+        Returns:
+            z_mat (np.array): Extended low-fidelity tensor with the low-fidelity output and the
+                              features along the first axis.
+        """
+        num_coordinates = y_lf_mat.shape[1]
+        z_mat = np.concatenate(
+            (
+                y_lf_mat.T[:, :, np.newaxis],
+                np.broadcast_to(feature_mat, (num_coordinates, *feature_mat.shape)),
+            ),
+            axis=2,
+        )
+        return z_mat.squeeze().T
+
     def _get_opt_features(self, *_):
         """Get the low-fidelity feature matrix with optimal features.
 
@@ -419,11 +439,7 @@ class BMFIAIterator(Iterator):
                 coord_feature.shape[0] == y_lf_mat.shape[0]
             ), "Dimensions of coords_feature and y_lf_mat do not agree! Abort..."
 
-            z_lst = []
-            for y_per_coordinate in y_lf_mat.T:
-                z_lst.append(np.hstack([y_per_coordinate.reshape(-1, 1), coord_feature]))
-
-            z_mat = np.array(z_lst).squeeze().T
+            z_mat = self._stack_with_features(y_lf_mat, coord_feature)
             assert (
                 z_mat.ndim == 3
             ), "z_mat should be a 3d tensor if coord_features are used! Abort..."
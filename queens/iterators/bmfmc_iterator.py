@@ -215,11 +215,13 @@ class BMFMCIterator(Iterator):
         prelim_subset = psa_select(design, n_points, selection_target="max_dist_from_boundary")
 
         # return training data for outputs and corresponding inputs
-        index = np.vstack(
-            np.array(
-                np.all((design[:, None, :] == prelim_subset[None, :, :]), axis=-1).nonzero()
-            ).T.tolist()
-        )[:, 0]
+        # (rows are compared as single opaque items instead of elementwise across all pairs)
+        row_dtype = np.dtype((np.void, design.dtype.itemsize * design.shape[1]))
+        design_rows = np.ascontiguousarray(design).view(row_dtype).ravel()
+        subset_rows = (
+            np.ascontiguousarray(prelim_subset, dtype=design.dtype).view(row_dtype).ravel()
+        )
+        index = np.flatnonzero(np.isin(design_rows, subset_rows))
 
         # set the training data and indices in the BMFMC model and iterator
         self.model.training_indices = index
@@ -18,6 +18,7 @@ import logging
 
 import numpy as np
 from pyDOE import lhs
+from scipy.stats import qmc
 
 from queens.iterators.iterator import Iterator
 from queens.utils.logger_settings import log_init_args
@@ -25,6 +26,9 @@ from queens.utils.process_outputs import process_outputs, write_results
 
 _logger = logging.getLogger(__name__)
 
+# criteria that are handled by the optimized scipy sampler instead of pyDOE
+SCIPY_CRITERIA = ("random-cd", "lloyd")
+
 
 class LHSIterator(Iterator):
     """Basic LHS Iterator to enable Latin Hypercube sampling.
@@ -40,6 +44,8 @@ class LHSIterator(Iterator):
             *   *maximin* or *m*
             *   *centermaximin* or *cm*
             *   *correlation* or *corr*
+            *   *random-cd* or *lloyd* (scipy's optimized Latin hypercube, *lloyd* does not
+                strictly keep the Latin hypercube property)
         samples (np.array):   Array with all samples.
         output (np.array):   Array with all model outputs.
     """
@@ -68,7 +74,9 @@ class LHSIterator(Iterator):
             result_description (dict, opt):  Description of desired results
             num_iterations (int): Number of optimization iterations of design
             criterion (str): Allowable values are "center" or "c", "maximin" or "m",
-                             "centermaximin" or "cm", and "correlation" or "corr"
+                             "centermaximin" or "cm", and "correlation" or "corr". The values
+                             "random-cd" and "lloyd" use scipy's optimized Latin hypercube
+                             sampler, for which *num_iterations* is ignored.
         """
         super().__init__(model, parameters, global_settings)
         self.seed = seed
@@ -91,9 +99,16 @@ class LHSIterator(Iterator):
         _logger.info("Number of iterations: %s", self.num_iterations)
 
         # create latin hyper cube samples in unit hyper cube
-        hypercube_samples = lhs(
-            num_inputs, self.num_samples, criterion=self.criterion, iterations=self.num_iterations
-        )
+        if self.criterion in SCIPY_CRITERIA:
+            sampler = qmc.LatinHypercube(d=num_inputs, optimization=self.criterion, seed=self.seed)
+            hypercube_samples = sampler.random(self.num_samples)
+        else:
+            hypercube_samples = lhs(
+                num_inputs,
+                self.num_samples,
+                criterion=self.criterion,
+                iterations=self.num_iterations,
+            )
         # scale and transform samples according to the inverse cdf
         self.samples = self.parameters.inverse_cdf_transform(hypercube_samples)
 
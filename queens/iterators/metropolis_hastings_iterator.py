@@ -215,13 +215,14 @@ class MetropolisHastingsIterator(Iterator):
 
         self.chains[step_id] = new_sample
 
-        self.log_likelihood[step_id] = np.where(
-            accepted, log_likelihood_prop, self.log_likelihood[step_id - 1]
-        )
-        self.log_prior[step_id] = np.where(accepted, log_prior_prop, self.log_prior[step_id - 1])
-        self.log_posterior[step_id] = np.where(
-            accepted, log_posterior_prop, self.log_posterior[step_id - 1]
-        )
+        # carry over the previous values and overwrite the accepted chains in place
+        for log_density, log_density_prop in (
+            (self.log_likelihood, log_likelihood_prop),
+            (self.log_prior, log_prior_prop),
+            (self.log_posterior, log_posterior_prop),
+        ):
+            log_density[step_id] = log_density[step_id - 1]
+            np.copyto(log_density[step_id], log_density_prop, where=accepted)
 
     def pre_run(
         self,
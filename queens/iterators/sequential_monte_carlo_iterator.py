@@ -241,6 +241,17 @@ class SequentialMonteCarloIterator(Iterator):
         weights_scaling = self.temper(self.log_prior, self.log_likelihood, gamma_new) - self.temper(
             self.log_prior, self.log_likelihood, gamma_old
         )
+        return self.scale_weights(weights_scaling)
+
+    def scale_weights(self, weights_scaling):
+        """Scale the current weights in log space and normalize them.
+
+        Args:
+            weights_scaling (np.array): Change of the tempered logpdf of the particles
+
+        Returns:
+            weights_new (np.array): New and normalized weights
+        """
         a_norm = np.max(weights_scaling)
 
         log_weights_new = np.log(self.weights) + weights_scaling
@@ -251,20 +262,6 @@ class SequentialMonteCarloIterator(Iterator):
 
         return weights_new
 
-    def calc_new_ess(self, gamma_new, gamma_old):
-        """Calculate predicted Effective Sample Size at *gamma_new*.
-
-        Args:
-            gamma_new (float): New gamma value.
-            gamma_old (float): Previous gamma value.
-
-        Returns:
-            ess (float): Effective sample size for the new gamma value.
-        """
-        weights_new = self.calc_new_weights(gamma_new, gamma_old)
-        ess = smc_utils.calc_ess(weights_new)
-        return ess
-
     def calc_new_gamma(self, gamma_cur):
         """Calculate the new gamma value.
 
@@ -279,9 +276,14 @@ class SequentialMonteCarloIterator(Iterator):
             gamma_new (float): Updated gamma value.
         """
         zeta = 0.95
+        # the tempered logpdf at the current gamma does not change during the root finding
+        log_tempered_cur = self.temper(self.log_prior, self.log_likelihood, gamma_cur)
 
         def f(gamma_new):
-            ess_new = self.calc_new_ess(gamma_new, gamma_cur)
+            weights_scaling = (
+                self.temper(self.log_prior, self.log_likelihood, gamma_new) - log_tempered_cur
+            )
+            ess_new = smc_utils.calc_ess(self.scale_weights(weights_scaling))
 
             f = ess_new - zeta * self.ess_cur
             return f
@@ -19,7 +19,7 @@ import logging
 
 import numpy as np
 import scipy.stats as st
-from sklearn.preprocessing import StandardScaler
+from numba import njit, prange
 from tqdm import tqdm
 
 import queens.utils.pdf_estimation as est
@@ -90,6 +90,8 @@ class BMFMCModel(Model):
                             contains in one row scalar results for different LF models. (In the
                             future we will change the format to pandas dataframes to handle
                             vectorized/functional outputs for different models more elegantly).
+        Y_LFs_mc_stdized (np.array): Column-wise standardized *Y_LFs_mc*, computed once on
+                                     first use and reset whenever new sampling data is loaded.
         Y_HF_mc (np.array): (optional for benchmarking) Output vector/matrix for the HF model
                             that corresponds to the *X_mc* according to
                             :math:`Y_{HF}^*=y_{HF}(X^*)`.
@@ -120,6 +122,13 @@ class BMFMCModel(Model):
                               :math:`\mathbb{V}_{f^*}\left[p(y_{HF}^*|f^*,D_f)\right]`
                               according to eq. (15) in [1].
         predictive_var_bool (bool): Flag that determines whether *p_yhf_var* should be computed.
+        pair_subsample_fraction (float): Fraction of the Monte-Carlo points that is randomly
+                                         subsampled to estimate *p_yhf_var*, whose cost scales
+                                         quadratically with the number of points.
+        seed (int): Seed for the random subsample of the Monte-Carlo points.
+        reduced_precision (bool): Flag that determines whether the standardized data for the
+                                  ranking of the informative features is kept in single
+                                  precision.
         p_yhf_mc (np.array): (optional) Monte-Carlo based kernel-density estimate of the HF output.
         p_ylf_mc (np.array): (optional) Kernel density estimate for LF model output.
                             **Note:** For BMFMC the explicit density is never required, only the
@@ -169,6 +178,9 @@ class BMFMCModel(Model):
         hf_model=None,
         path_to_lf_mc_data=None,
         path_to_hf_mc_reference_data=None,
+        pair_subsample_fraction=1.0,
+        seed=42,
+        reduced_precision=False,
     ):
         r"""Initialize the Bayesian Multi-Fidelity Monte-Carlo (BMFMC) Model.
 
@@ -204,6 +216,14 @@ class BMFMCModel(Model):
                                                                files.
             path_to_hf_mc_reference_data (str, optional): Path to high-fidelity MC reference data
                                                           file.
+            pair_subsample_fraction (float, optional): Fraction of the Monte-Carlo points that is
+                                                       randomly subsampled to estimate
+                                                       *p_yhf_var*.
+            seed (int, optional): Seed for the random subsample of the Monte-Carlo points.
+            reduced_precision (bool, optional): If *True*, the standardized input and output data
+                                                used to rank the informative features is kept in
+                                                single precision, which halves the memory traffic
+                                                of the ranking.
         """
         # TODO the unlabeled treatment of raw data for eigenfunc_random_fields and input vars and # pylint: disable=fixme
         #  random fields is prone to errors and should be changed! The implementation should
@@ -234,6 +254,7 @@ class BMFMCModel(Model):
         self.Y_LFs_train = None
         self.X_mc = None
         self.Y_LFs_mc = None
+        self.Y_LFs_mc_stdized = None
         self.Y_HF_mc = None
         self.gammas_ext_mc = None
         self.gammas_ext_train = None
@@ -244,6 +265,13 @@ class BMFMCModel(Model):
         self.p_yhf_mean = None
         self.p_yhf_var = None
         self.predictive_var_bool = predictive_var
+        if not 0.0 < pair_subsample_fraction <= 1.0:
+            raise ValueError(
+                f"The pair_subsample_fraction has to be in (0, 1], but is {pair_subsample_fraction}!"
+            )
+        self.pair_subsample_fraction = pair_subsample_fraction
+        self.seed = seed
+        self.reduced_precision = reduced_precision
         self.p_yhf_mc = None
         self.p_ylf_mc = None
         self.no_features_comparison_bool = BMFMC_reference
@@ -413,32 +441,26 @@ class BMFMCModel(Model):
         QUEENS. Check if high-fidelity benchmark data is available and
         load this as well.
         """
+        # every LF data file is read only once
+        lf_data = [
+            lf_data_iterator.read_pickle_file() for lf_data_iterator in self.lf_data_iterators
+        ]
+
         # --------------------- load description for random fields/ parameters ---------
         # here we load the random parameter description from the pickle file
         # we load the description of the uncertain parameters from the first lf iterator
         # (note: all lf iterators have the same description)
-        self.uncertain_parameters = (
-            self.lf_data_iterators[0].read_pickle_file().get("input_description")
-        )
+        self.uncertain_parameters = lf_data[0].get("input_description")
 
         # --------------------- load LF sampling raw data with data iterators --------------
-        self.X_mc = self.lf_data_iterators[0].read_pickle_file().get("input_data")
+        self.X_mc = lf_data[0].get("input_data")
         # here we assume that all lfs have the same input vector
-        try:
-            self.eigenfunc_random_fields = (
-                self.lf_data_iterators[0].read_pickle_file().get("eigenfunc")
-            )
-            self.eigenvals = self.lf_data_iterators[0].read_pickle_file().get("eigenvalue")
-        except IOError:
-            self.eigenfunc_random_fields = None
-            self.eigenvals = None
-
-        Y_LFs_mc = [
-            lf_data_iterator.read_pickle_file().get("output")[:, 0]
-            for lf_data_iterator in self.lf_data_iterators
-        ]
+        self.eigenfunc_random_fields = lf_data[0].get("eigenfunc")
+        self.eigenvals = lf_data[0].get("eigenvalue")
 
+        Y_LFs_mc = [data.get("output")[:, 0] for data in lf_data]
         self.Y_LFs_mc = np.atleast_2d(np.vstack(Y_LFs_mc)).T
+        self.Y_LFs_mc_stdized = None
 
         # ------------------- Deal with potential HF-MC data --------------------------
         if self.hf_data_iterator is not None:
@@ -542,59 +564,59 @@ class BMFMCModel(Model):
         self.p_yhf_mean = 1 / self.m_f_mc.size * pyhf_mean_vec
 
     def calculate_p_yhf_var(self):
-        """Calculate the posterior variance of the HF density prediction."""
+        """Calculate the posterior variance of the HF density prediction.
+
+        The variance requires the evaluation of bivariate normal densities for all pairs of
+        Monte-Carlo points, which scales quadratically with their number. If
+        *pair_subsample_fraction* is smaller than one, only a random subsample of the Monte-Carlo
+        points is used for this (unbiased) estimate.
+        """
         # calculate full posterior covariance matrix for testing points
         _, k_post = self.interface.evaluate(self.Z_mc.T)
 
-        spacing = 1
-        f_mean_pred = self.m_f_mc[0::spacing, :]
-        yhf_var_pred = self.var_y_mc[0::spacing, :]
-        k_post = k_post[0::spacing, 0::spacing]
-
-        # Define support structure for computation
-        points = np.vstack((self.y_pdf_support, self.y_pdf_support)).T
-
-        # Define the outer loop (addition of all multivariate normal distributions
-        yhf_pdf_grid = np.zeros((points.shape[0],))
-        i = 1
+        f_mean_pred = self.m_f_mc[:, 0]
+        yhf_var_pred = self.var_y_mc[:, 0]
+        num_samples = f_mean_pred.size
+        if num_samples < 2:
+            raise ValueError(
+                f"The variance of the HF density requires at least two Monte-Carlo points, but "
+                f"{num_samples} were provided!"
+            )
+        if self.pair_subsample_fraction < 1.0:
+            subsample_size = max(int(num_samples * self.pair_subsample_fraction), 2)
+            rng = np.random.default_rng(self.seed)
+            idx = np.sort(rng.choice(num_samples, size=subsample_size, replace=False))
+            f_mean_pred = f_mean_pred[idx]
+            yhf_var_pred = yhf_var_pred[idx]
+            k_post = k_post[np.ix_(idx, idx)]
+
+        num_points = f_mean_pred.size
+        y_support = np.atleast_2d(self.y_pdf_support).T
+
+        # Add all bivariate normal distributions (evaluated on the diagonal of the 2D support)
+        yhf_pdf_grid = np.zeros(y_support.shape[0])
         _logger.info("\n")
-
-        # TODO we should speed this up with multiprocessing # pylint: disable=fixme
-        for num1, (mean1, var1) in enumerate(
-            zip(tqdm(f_mean_pred, desc=r"Calculating Var_f[p(y_HF|f,z,D)]"), yhf_var_pred)
-        ):
-            for num2, (mean2, var2) in enumerate(
-                zip(f_mean_pred[num1 + 1 :], yhf_var_pred[num1 + 1 :])
-            ):
-                num2 = num1 + num2
-                covariance = k_post[num1, num2]
-                mean_vec = np.array([mean1, mean2])
-                diff = points - mean_vec.T
-                det_sigma = var1 * var2 - covariance**2
-
-                if det_sigma < 0:
-                    det_sigma = 1e-6
-                    covariance = 0.95 * covariance
-
-                inv_sigma = (
-                    1
-                    / det_sigma
-                    * np.array(
-                        [np.append(var2, -covariance), np.insert(var1, 0, -covariance)],
-                        dtype=np.float64,
-                    )
-                )
-
-                a = np.dot(diff, inv_sigma)
-                b = np.einsum("ij,ij->i", a, diff)
-                c = np.sqrt(4 * np.pi**2 * det_sigma)
-                args = -0.5 * b + np.log(1 / c)
-                args[args > 40] = 40  # limit arguments for for better conditioning
-                yhf_pdf_grid += np.exp(args)
-                i = i + 1
-
-                # Define inner loop (add rows of 2D domain to yield variance function)
-                self.p_yhf_var = 1 / (i - 1) * yhf_pdf_grid - 0.9995 * self.p_yhf_mean**2
+        for num1 in tqdm(range(num_points - 1), desc=r"Calculating Var_f[p(y_HF|f,z,D)]"):
+            mean1 = f_mean_pred[num1]
+            var1 = yhf_var_pred[num1]
+            mean2 = f_mean_pred[num1 + 1 :]
+            var2 = yhf_var_pred[num1 + 1 :]
+            covariance = k_post[num1, num1 + 1 :]
+
+            det_sigma = var1 * var2 - covariance**2
+            negative_det = det_sigma < 0
+            det_sigma[negative_det] = 1e-6
+            covariance = np.where(negative_det, 0.95 * covariance, covariance)
+
+            diff1 = y_support - mean1
+            diff2 = y_support - mean2
+            b = (diff1**2 * var2 - 2 * covariance * diff1 * diff2 + diff2**2 * var1) / det_sigma
+            args = -0.5 * b - np.log(2 * np.pi * np.sqrt(det_sigma))
+            args[args > 40] = 40  # limit arguments for for better conditioning
+            yhf_pdf_grid += np.sum(np.exp(args), axis=1)
+
+        num_pairs = num_points * (num_points - 1) // 2
+        self.p_yhf_var = 1 / num_pairs * yhf_pdf_grid - 0.9995 * self.p_yhf_mean**2
 
     def compute_pymc_reference(self):
         """Compute reference kernel density estimate.
@@ -610,17 +632,13 @@ class BMFMCModel(Model):
 
         if self.Y_HF_mc is not None:
             # perform kde with the optimized bandwidth in case HF MC is given
-            self.p_yhf_mc, _ = est.estimate_pdf(
-                np.atleast_2d(self.Y_HF_mc),
-                bandwidth_lfmc,
-                support_points=np.atleast_2d(self.y_pdf_support),
+            self.p_yhf_mc, _ = est.estimate_pdf_fft(
+                self.Y_HF_mc, bandwidth_lfmc, support_points=self.y_pdf_support
             )
 
         if self.Y_LFs_train.shape[1] < 2:
-            self.p_ylf_mc, _ = est.estimate_pdf(
-                np.atleast_2d(self.Y_LFs_mc).T,
-                bandwidth_lfmc,
-                support_points=np.atleast_2d(self.y_pdf_support),
+            self.p_ylf_mc, _ = est.estimate_pdf_fft(
+                self.Y_LFs_mc[:, 0], bandwidth_lfmc, support_points=self.y_pdf_support
             )  # TODO: make this also work for several lfs # pylint: disable=fixme
 
     def set_feature_strategy(self):
@@ -662,41 +680,32 @@ class BMFMCModel(Model):
         composed by :math:`y_{\text{LF}}` and
         :math:`\boldsymbol{\gamma_{LF}}`.
         """
-        x_red = self.input_dim_red()  # this is also standardized
-        x_iter_test = x_red
-        self.gammas_ext_mc = np.empty((x_iter_test.shape[0], 0))
-
-        # standardize the LF output vector for better performance
-        Y_LFS_mc_stdized = StandardScaler().fit_transform(self.Y_LFs_mc)
-
-        # Iteratively sort reduced input space by importance of its dimensions
-        for counter in range(x_red.shape[1]):
-            # calculate the scores/ranking of candidates for informative input features gamma_i
-            # by projecting the (dim. reduced) input on the LFs output
-            corr_coef_unnorm = np.abs(np.dot(x_iter_test.T, Y_LFS_mc_stdized))
-
-            # --------- plot the rankings/scores for first iteration -------------------------------
-            if counter == 0:
-                ele = np.arange(1, x_iter_test.shape[1] + 1)
-                if qvis.bmfmc_visualization_instance:
-                    qvis.bmfmc_visualization_instance.plot_feature_ranking(
-                        ele, corr_coef_unnorm, counter
-                    )
-            # --------------------------------------------------------------------------------------
-
-            # select input feature with the highest score
-            select_bool = corr_coef_unnorm == np.max(corr_coef_unnorm)
-            test_iter = np.dot(x_iter_test, select_bool)
-
-            # substract last choice from candidate pool
-            x_iter_test = np.atleast_2d(x_iter_test[:, ~select_bool[:, 0]])
-
-            # Scale features linearly to LF output data so that probabilistic model
-            # can be fit easier
-            features_test = linear_scale_a_to_b(test_iter, self.Y_LFs_mc)
-
-            # Assemble feature vectors and informative features
-            self.gammas_ext_mc = np.hstack((self.gammas_ext_mc, features_test))
+        # the ranking is insensitive to single precision, the features are scaled back below
+        dtype = np.float32 if self.reduced_precision else np.float64
+        x_red = self.input_dim_red(dtype=dtype)  # this is also standardized
+
+        # standardize the LF output vector for better performance (only once per dataset)
+        if self.Y_LFs_mc_stdized is None:
+            self.Y_LFs_mc_stdized = standardize(self.Y_LFs_mc, dtype=dtype)
+
+        # calculate the scores/ranking of candidates for informative input features gamma_i
+        # by projecting the (dim. reduced) input on the LFs output
+        corr_coef_unnorm = np.abs(np.dot(x_red.T, self.Y_LFs_mc_stdized))
+
+        # --------- plot the rankings/scores of the candidates ---------------------------------
+        if qvis.bmfmc_visualization_instance:
+            ele = np.arange(1, x_red.shape[1] + 1)
+            qvis.bmfmc_visualization_instance.plot_feature_ranking(ele, corr_coef_unnorm, 0)
+        # --------------------------------------------------------------------------------------
+
+        # sort reduced input space by importance of its dimensions (highest score first)
+        ranking = np.argsort(-np.max(corr_coef_unnorm, axis=1), kind="stable")
+
+        # Scale features linearly to LF output data so that probabilistic model
+        # can be fit easier
+        self.gammas_ext_mc = linear_scale_a_to_b(
+            x_red[:, ranking].astype(np.float64, copy=False), self.Y_LFs_mc, axis=0
+        )
 
     def update_probabilistic_mapping_with_features(self):
         r"""Update probabilistic mapping.
@@ -724,7 +733,7 @@ class BMFMCModel(Model):
         self.m_f_mc, self.var_y_mc = self.interface.evaluate(self.Z_mc.T)
         self.f_mean_train, _ = self.interface.evaluate(self.Z_train.T)
 
-    def input_dim_red(self):
+    def input_dim_red(self, dtype=np.float64):
         """Reduce dimensionality of the input space.
 
         Unsupervised dimensionality reduction of the input space. The random
@@ -737,6 +746,9 @@ class BMFMCModel(Model):
         input vector which is also standardized along each of the remaining
         dimensions.
 
+        Args:
+            dtype (np.dtype): Floating point type of the standardized reduced input.
+
         Returns:
             X_red_test_stdizd (np.array): Dimensionality reduced input matrix corresponding to
             testing/sampling data for the probabilistic mapping
@@ -749,7 +761,7 @@ class BMFMCModel(Model):
         else:
             coefs_mat = None
 
-        X_red_test_stdizd = assemble_x_red_stdizd(x_uncorr, coefs_mat)
+        X_red_test_stdizd = assemble_x_red_stdizd(x_uncorr, coefs_mat, dtype=dtype)
         return X_red_test_stdizd
 
     def get_random_fields_and_truncated_basis(self, explained_var=95.0):
@@ -779,41 +791,30 @@ class BMFMCModel(Model):
         x_uncorr = self.X_mc[:, 0:num_random_var]
 
         # iterate over all random fields
-        dim_random_fields = 0
+        # Attention: Here we assume that X_mc contains in the first columns uncorrelated
+        #            random variables until the column id 'num_random_var' and then only
+        #            random fields
         if self.parameters.random_field_flag:
-            for random_field, basis, eigenvals in zip(
+            random_fields_trunc_dict = {}
+            col_start = num_random_var
+            for (field_name, random_field), (_, basis_vals), (_, eig_vals) in zip(
                 random_fields_list,
                 self.eigenfunc_random_fields.items(),
                 self.eigenvals.items(),
             ):
-                # write the simulated samples of the random fields also in the new dictionary
-                # Attention: Here we assume that X_mc contains in the first columns uncorrelated
-                #            random variables until the column id 'num_random_var' and then only
-                #            random fields
-                random_fields_trunc_dict = {
-                    random_field[0]: {
-                        "samples": self.X_mc[
-                            :,
-                            num_random_var
-                            + dim_random_fields : num_random_var
-                            + dim_random_fields
-                            + random_field[1].dimension,
-                        ]
-                    }
-                }
+                col_end = col_start + random_field.dimension
 
-                # determine the truncation basis
-                idx_truncation = [
-                    idx for idx, eigenval in enumerate(eigenvals[1]) if eigenval >= explained_var
-                ][0]
+                # determine the truncation basis (eigenvalues are given as cumulated percentages)
+                idx_truncation = int(np.searchsorted(eig_vals, explained_var))
 
-                # write the truncated basis also in the dictionary
-                random_fields_trunc_dict[random_field[0]].update(
-                    {"trunc_basis": basis[1][0:idx_truncation]}
-                )
+                # write the simulated samples of the random fields and their truncated basis
+                random_fields_trunc_dict[field_name] = {
+                    "samples": self.X_mc[:, col_start:col_end],
+                    "trunc_basis": basis_vals[0:idx_truncation],
+                }
 
-                # adjust the counter for next iteration
-                dim_random_fields += random_field[1].dimension
+                # adjust the column offset for next iteration
+                col_start = col_end
         else:
             random_fields_trunc_dict = None
 
@@ -835,16 +836,22 @@ def project_samples_on_truncated_basis(truncated_basis_dict, num_samples):
         coefs_mat (np.array): Matrix containing the reduced representation of all random fields
                               stacked together along the columns.
     """
-    coefs_mat = np.empty((num_samples, 0))
-
-    # iterate over random fields
-    for basis in truncated_basis_dict.items():
-        coefs_mat = np.hstack((coefs_mat, np.dot(basis[1]["samples"], basis[1]["trunc_basis"].T)))
+    num_coefs = sum(field["trunc_basis"].shape[0] for field in truncated_basis_dict.values())
+    coefs_mat = np.empty((num_samples, num_coefs))
+
+    # iterate over random fields and write their coefficients in the corresponding columns
+    offset = 0
+    for field in truncated_basis_dict.values():
+        num_field_coefs = field["trunc_basis"].shape[0]
+        coefs_mat[:, offset : offset + num_field_coefs] = np.dot(
+            field["samples"], field["trunc_basis"].T
+        )
+        offset += num_field_coefs
 
     return coefs_mat
 
 
-def linear_scale_a_to_b(data_a, data_b):
+def linear_scale_a_to_b(data_a, data_b, axis=None):
     """Scale linearly.
 
     Scale a data vector 'data_a' linearly to the range of data vector
@@ -853,24 +860,74 @@ def linear_scale_a_to_b(data_a, data_b):
     Args:
         data_a (np.array): Data vector that should be scaled.
         data_b (np.array): Reference data vector that provides the range for scaling.
+        axis (int, optional): Axis along which *data_a* is scaled. Per default, the whole array
+                              is scaled at once. For *axis=0*, each column of *data_a* is scaled
+                              individually.
 
     Returns:
        scaled_a (np.array): Scaled data_a vector.
     """
     min_b = np.min(data_b)
-    max_b = np.max(data_b)
-    scaled_a = min_b + (data_a - np.min(data_a)) * (
-        (max_b - min_b) / (np.max(data_a) - np.min(data_a))
-    )
+    range_b = np.max(data_b) - min_b
+    min_a = np.min(data_a, axis=axis, keepdims=True)
+    range_a = np.max(data_a, axis=axis, keepdims=True) - min_a
+    scaled_a = min_b + (data_a - min_a) * (range_b / range_a)
     return scaled_a
 
 
-def assemble_x_red_stdizd(x_uncorr, coef_mat):
+def standardize(data, dtype=np.float64):
+    """Standardize data column-wise to zero mean and unit variance.
+
+    Columns with zero variance are only centered (as done by sklearn's *StandardScaler*).
+
+    Args:
+        data (np.array): Data matrix with samples row-wise.
+        dtype (np.dtype): Floating point type of the standardized data matrix.
+
+    Returns:
+        data_stdizd (np.array): Standardized data matrix.
+    """
+    # column-major layout so that every column is a contiguous block for the jitted kernel
+    data_stdizd = np.empty(np.shape(data), dtype=dtype, order="F")
+    standardize_columns(np.asfortranarray(data, dtype=np.float64), data_stdizd)
+    return data_stdizd
+
+
+@njit(parallel=True, fastmath={"reassoc", "contract"})
+def standardize_columns(data, data_stdizd):
+    """Standardize the columns of a matrix in three sweeps per column.
+
+    The statistics are accumulated in double precision independent of the type of the output.
+
+    Args:
+        data (np.ndarray): Data matrix with samples row-wise (column-major layout preferred)
+        data_stdizd (np.ndarray): Preallocated output for the standardized data matrix
+    """
+    num_samples, num_columns = data.shape
+    for j in prange(num_columns):  # pylint: disable=not-an-iterable
+        column_sum = 0.0
+        for i in range(num_samples):
+            column_sum += data[i, j]
+        mean = column_sum / num_samples
+
+        squared_sum = 0.0
+        for i in range(num_samples):
+            squared_sum += (data[i, j] - mean) ** 2
+        std = np.sqrt(squared_sum / num_samples)
+        if std == 0.0:
+            std = 1.0
+
+        for i in range(num_samples):
+            data_stdizd[i, j] = (data[i, j] - mean) / std
+
+
+def assemble_x_red_stdizd(x_uncorr, coef_mat, dtype=np.float64):
     """Assemble and standardize the dimension-reduced input x_red.
 
     Args:
         x_uncorr (np.array): Samples of remaining uncorrelated random variables.
         coef_mat (np.array): Optional coefficient matrix to concatenate.
+        dtype (np.dtype): Floating point type of the standardized input.
 
     Returns:
         X_red_test_stdizd (np.array): Standardized dimension-reduced input.
@@ -879,5 +936,5 @@ def assemble_x_red_stdizd(x_uncorr, coef_mat):
         x_red = np.hstack((x_uncorr, coef_mat))
     else:
         x_red = x_uncorr
-    X_red_test_stdizd = StandardScaler().fit_transform(x_red)
+    X_red_test_stdizd = standardize(x_red, dtype=dtype)
     return X_red_test_stdizd
@@ -18,13 +18,57 @@ import abc
 import logging
 
 import numpy as np
+from numba import njit, prange
 from sklearn.model_selection import KFold
 
 import queens.visualization.surrogate_visualization as qvis
 from queens.models.model import Model
+from queens.utils.valid_options_utils import check_if_valid_options
 
 _logger = logging.getLogger(__name__)
 
+# error measures that only depend on the statistics of the errors
+ERROR_MEASURES = {
+    "sum_squared": lambda statistics: statistics["sum_squared"],
+    "mean_squared": lambda statistics: statistics["sum_squared"] / statistics["num_samples"],
+    "root_mean_squared": lambda statistics: np.sqrt(
+        statistics["sum_squared"] / statistics["num_samples"]
+    ),
+    "sum_abs": lambda statistics: statistics["sum_abs"],
+    "mean_abs": lambda statistics: statistics["sum_abs"] / statistics["num_samples"],
+    "abs_max": lambda statistics: statistics["abs_max"],
+}
+VALID_ERROR_MEASURES = [*ERROR_MEASURES, "nash_sutcliffe_efficiency"]
+
+
+@njit(parallel=True, fastmath={"reassoc", "contract"})
+def error_statistics(y_test, y_posterior_mean):
+    """Compute the statistics of the errors in a single pass.
+
+    Args:
+        y_test (np.ndarray): Output values from testing data set (flattened)
+        y_posterior_mean (np.ndarray): Posterior mean values (flattened)
+
+    Returns:
+        sum_squared (float): Sum of squared errors
+        sum_abs (float): Sum of absolute errors
+        abs_max (float): Maximum absolute error
+    """
+    sum_squared = 0.0
+    sum_abs = 0.0
+    abs_max = 0.0
+    num_nan = 0
+    for i in prange(y_test.shape[0]):  # pylint: disable=not-an-iterable
+        error = y_test[i] - y_posterior_mean[i]
+        sum_squared += error * error
+        sum_abs += abs(error)
+        abs_max = max(abs_max, abs(error))
+        num_nan += np.isnan(error)
+    # max discards NaN, so it is propagated explicitly as np.max would do
+    if num_nan > 0:
+        abs_max = np.nan
+    return sum_squared, sum_abs, abs_max
+
 
 class SurrogateModel(Model):
     """Surrogate model class.
@@ -222,10 +266,12 @@ class SurrogateModel(Model):
 
         return outputs
 
-    def compute_error_measures(self, y_test, y_posterior_mean, measures):
+    @staticmethod
+    def compute_error_measures(y_test, y_posterior_mean, measures):
         """Compute error measures.
 
-        Compute based on difference between predicted and actual values.
+        Compute based on difference between predicted and actual values. The statistics of the
+        errors are computed in a single (jitted) pass and shared by all error measures.
 
         Args:
             y_test (ndarray): Output values from testing data set
@@ -235,9 +281,27 @@ class SurrogateModel(Model):
         Returns:
             dict: Dictionary with error measures and corresponding error values
         """
+        check_if_valid_options(VALID_ERROR_MEASURES, measures)
+        y_test_flat, y_posterior_mean_flat = (
+            np.ravel(array).astype(np.float64, copy=False)
+            for array in np.broadcast_arrays(y_test, y_posterior_mean)
+        )
+        sum_squared, sum_abs, abs_max = error_statistics(y_test_flat, y_posterior_mean_flat)
+        statistics = {
+            "sum_squared": sum_squared,
+            "sum_abs": sum_abs,
+            "abs_max": abs_max,
+            "num_samples": y_test_flat.size,
+        }
+
         error_measures = {}
         for measure in measures:
-            error_measures[measure] = self.compute_error(y_test, y_posterior_mean, measure)
+            if measure == "nash_sutcliffe_efficiency":
+                error_measures[measure] = SurrogateModel.compute_nash_sutcliffe_efficiency(
+                    y_test, y_posterior_mean
+                )
+            else:
+                error_measures[measure] = ERROR_MEASURES[measure](statistics)
         return error_measures
 
     @staticmethod
@@ -252,17 +316,7 @@ class SurrogateModel(Model):
         Returns:
             float: Error based on desired metric
         """
-        return {
-            "sum_squared": lambda: np.sum((y_test - y_posterior_mean) ** 2),
-            "mean_squared": lambda: np.mean((y_test - y_posterior_mean) ** 2),
-            "root_mean_squared": lambda: np.sqrt(np.mean((y_test - y_posterior_mean) ** 2)),
-            "sum_abs": lambda: np.sum(np.abs(y_test - y_posterior_mean)),
-            "mean_abs": lambda: np.mean(np.abs(y_test - y_posterior_mean)),
-            "abs_max": lambda: np.max(np.abs(y_test - y_posterior_mean)),
-            "nash_sutcliffe_efficiency": lambda: SurrogateModel.compute_nash_sutcliffe_efficiency(
-                y_test, y_posterior_mean
-            ),
-        }.get(measure, NotImplementedError("Desired error measure is unknown!"))()
+        return SurrogateModel.compute_error_measures(y_test, y_posterior_mean, [measure])[measure]
 
     @staticmethod
     def compute_nash_sutcliffe_efficiency(y_test, y_posterior_mean):
@@ -17,6 +17,7 @@
 import logging
 
 import numpy as np
+from scipy.linalg import eigh
 from scipy.spatial.distance import pdist, squareform
 
 from queens.distributions.mean_field_normal import MeanFieldNormalDistribution
@@ -168,27 +169,32 @@ class KarhunenLoeveRandomField(RandomField):
         """Decompose and then truncate the random field.
 
         According to desired variance fraction that should be
-        covered/explained by the truncation.
+        covered/explained by the truncation. Only the leading eigenpairs
+        of the covariance matrix are computed; the total variance is given
+        by its trace.
         """
-        # compute eigendecomposition
-        eig_val, eig_vec = np.linalg.eigh(self.cov_matrix)
-        eigenvalues = np.flip(eig_val)
-        eigenvectors = np.flip(eig_vec, axis=1)
+        total_variance = np.trace(self.cov_matrix)
 
         if self.dimension is None:
-            eigenvalues_normed = eigenvalues / np.sum(eigenvalues)
+            # the eigenvalues alone are much cheaper than the full eigendecomposition
+            eigenvalues = np.flip(eigh(self.cov_matrix, eigvals_only=True))
+            eigenvalues_normed = eigenvalues / total_variance
             dimension = (np.cumsum(eigenvalues_normed) < self.explained_variance).argmin() + 1
             if dimension == 1 and eigenvalues_normed[0] <= self.explained_variance:
                 raise ValueError("Expansion failed.")
 
             self.dimension = dimension
 
-        # truncated eigenfunction base
-        self.eigenvalues = eigenvalues[: self.dimension]
-        self.eigenvectors = eigenvectors[:, : self.dimension]
+        # truncated eigenfunction base; the eigenvalues of this single partial solve are the ones
+        # stored, the first pass above only determines the truncation
+        eig_val, eig_vec = eigh(
+            self.cov_matrix, subset_by_index=[self.dim_coords - self.dimension, self.dim_coords - 1]
+        )
+        self.eigenvalues = np.flip(eig_val)
+        self.eigenvectors = np.flip(eig_vec, axis=1)
 
         if self.explained_variance is None:
-            self.explained_variance = np.sum(self.eigenvalues) / np.sum(eigenvalues)
+            self.explained_variance = np.sum(self.eigenvalues) / total_variance
             _logger.info("Explained variance is %f", self.explained_variance)
 
         # weight the eigenbasis with the eigenvalues
@@ -16,6 +16,7 @@
 
 import logging
 
+import dask
 from dask.distributed import Client, LocalCluster
 
 from queens.schedulers.dask_scheduler import DaskScheduler
@@ -44,12 +45,17 @@ class LocalScheduler(DaskScheduler):
         """
         experiment_dir = experiment_directory(experiment_name=experiment_name)
 
-        cluster = LocalCluster(
-            n_workers=num_jobs,
-            processes=True,
-            threads_per_worker=num_procs,
-            silence_logs=False,
-        )
+        # the jobs are numerical workloads whose data should stay in memory, so spilling to disk
+        # is disabled for the workers
+        with dask.config.set(
+            {"distributed.worker.memory.target": False, "distributed.worker.memory.spill": False}
+        ):
+            cluster = LocalCluster(
+                n_workers=num_jobs,
+                processes=True,
+                threads_per_worker=num_procs,
+                silence_logs=False,
+            )
         client = Client(cluster)
         _logger.info(
             "To view the Dask dashboard open this link in your browser: %s", client.dashboard_link
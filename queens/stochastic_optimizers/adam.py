@@ -17,13 +17,38 @@
 import logging
 
 import numpy as np
+from numba import njit
 
 from queens.stochastic_optimizers.stochastic_optimizer import StochasticOptimizer
-from queens.utils.iterative_averaging_utils import ExponentialAveraging
 
 _logger = logging.getLogger(__name__)
 
 
+@njit
+def _adam_step(m, v, gradient, beta_1, beta_2, bias_correction_1, bias_correction_2, eps):
+    """Update the moment averages in place and compute the Adam gradient in a single pass.
+
+    Args:
+        m (np.ndarray): Flat exponential average of the gradient
+        v (np.ndarray): Flat exponential average of the squared gradient
+        gradient (np.ndarray): Flat gradient
+        beta_1 (float): Coefficient of the gradient average
+        beta_2 (float): Coefficient of the squared gradient average
+        bias_correction_1 (float): Bias correction of the gradient average
+        bias_correction_2 (float): Bias correction of the squared gradient average
+        eps (float): Nugget term to avoid a division by values close to zero
+
+    Returns:
+        adam_gradient (np.ndarray): Flat Adam gradient
+    """
+    adam_gradient = np.empty_like(gradient)
+    for i in range(gradient.shape[0]):
+        m[i] = beta_1 * m[i] + (1 - beta_1) * gradient[i]
+        v[i] = beta_2 * v[i] + (1 - beta_2) * (gradient[i] * gradient[i])
+        adam_gradient[i] = (m[i] / bias_correction_1) / (np.sqrt(v[i] / bias_correction_2) + eps)
+    return adam_gradient
+
+
 class Adam(StochasticOptimizer):
     r"""Adam stochastic optimizer [1].
 
@@ -33,9 +58,11 @@ class Adam(StochasticOptimizer):
     Attributes:
         beta_1 (float):  :math:`\beta_1` parameter as described in [1].
         beta_2 (float):  :math:`\beta_2` parameter as described in [1].
-        m (ExponentialAveragingObject): Exponential average of the gradient.
-        v (ExponentialAveragingObject): Exponential average of the gradient momentum.
+        m (np.ndarray): Flat exponential average of the gradient.
+        v (np.ndarray): Flat exponential average of the squared gradient.
         eps (float): Nugget term to avoid a division by values close to zero.
+        beta_1_power (float): :math:`\beta_1` to the power of the number of updates.
+        beta_2_power (float): :math:`\beta_2` to the power of the number of updates.
     """
 
     _name = "Adam Stochastic Optimizer"
@@ -84,9 +111,11 @@ class Adam(StochasticOptimizer):
         )
         self.beta_1 = beta_1
         self.beta_2 = beta_2
-        self.m = ExponentialAveraging(coefficient=beta_1)
-        self.v = ExponentialAveraging(coefficient=beta_2)
+        self.m = None
+        self.v = None
         self.eps = eps
+        self.beta_1_power = 1.0
+        self.beta_2_power = 1.0
 
     def scheme_specific_gradient(self, gradient):
         """Adam gradient computation.
@@ -98,12 +127,23 @@ class Adam(StochasticOptimizer):
             gradient (np.array): Adam gradient
         """
         if self.iteration == 0:
-            self.m.current_average = np.zeros(gradient.shape)
-            self.v.current_average = np.zeros(gradient.shape)
-
-        m_hat = self.m.update_average(gradient)
-        v_hat = self.v.update_average(gradient**2)
-        m_hat /= 1 - self.beta_1 ** (self.iteration + 1)
-        v_hat /= 1 - self.beta_2 ** (self.iteration + 1)
-        gradient = m_hat / (v_hat**0.5 + self.eps)
-        return gradient
+            self.m = np.zeros(gradient.size)
+            self.v = np.zeros(gradient.size)
+            self.beta_1_power = 1.0
+            self.beta_2_power = 1.0
+
+        # update the bias corrections multiplicatively instead of recomputing the powers
+        self.beta_1_power *= self.beta_1
+        self.beta_2_power *= self.beta_2
+        # the averages are updated in place by the kernel
+        adam_gradient = _adam_step(
+            self.m,
+            self.v,
+            np.asarray(gradient, dtype=float).reshape(-1),
+            self.beta_1,
+            self.beta_2,
+            1 - self.beta_1_power,
+            1 - self.beta_2_power,
+            self.eps,
+        )
+        return adam_gradient.reshape(gradient.shape)
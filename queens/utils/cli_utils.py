@@ -18,13 +18,11 @@ import argparse
 import logging
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from queens.utils import ascii_art
 from queens.utils.exceptions import CLIError
-from queens.utils.injector import inject
-from queens.utils.input_to_script import create_script_from_input_file
 from queens.utils.logger_settings import reset_logging, setup_cli_logging
-from queens.utils.metadata import write_metadata_to_csv
 from queens.utils.path_utils import PATH_TO_QUEENS
 from queens.utils.pickle_utils import print_pickled_data
 from queens.utils.print_utils import get_str_table
@@ -32,6 +30,16 @@ from queens.utils.run_subprocess import run_subprocess
 
 _logger = logging.getLogger(__name__)
 
+# Only the CLI command in use should pay for importing its dependencies
+if TYPE_CHECKING:
+    from queens.utils import injector, input_to_script, metadata
+else:
+    from queens.utils.import_utils import LazyLoader
+
+    injector = LazyLoader("queens.utils.injector")
+    input_to_script = LazyLoader("queens.utils.input_to_script")
+    metadata = LazyLoader("queens.utils.metadata")
+
 
 def cli_logging(func):
     """Decorator to create logger for CLI function.
@@ -51,11 +59,24 @@ def cli_logging(func):
     return decorated_function
 
 
+def print_cli_banner(message="QUEENS", output_width=60):
+    """Print the crown and the banner of a CLI command.
+
+    The ascii art is skipped if the output is not a terminal, e.g. if it is piped or logged.
+
+    Args:
+        message (str): Message in banner
+        output_width (int): Terminal output width
+    """
+    if sys.stdout.isatty():
+        ascii_art.print_crown(output_width)
+        ascii_art.print_banner(message, output_width)
+
+
 @cli_logging
 def inject_template_cli():
     """Use the injector of QUEENS."""
-    ascii_art.print_crown(80)
-    ascii_art.print_banner("Injector", 80)
+    print_cli_banner("Injector", 80)
     parser = argparse.ArgumentParser(
         description="QUEENS injection CLI for Jinja2 templates. The parameters to be injected can "
         "be supplied by adding additional '--<name> <value>' arguments. All occurrences of <name> "
@@ -116,7 +137,7 @@ def inject_template_cli():
     # Create the dictionary
     injection_dict = vars(injection_parser.parse_args(parameter_arguments))
     _logger.info(get_str_table("Injection parameters", injection_dict))
-    inject(injection_dict, template_path, output_path)
+    injector.inject(injection_dict, template_path, output_path)
 
     _logger.info("Injection done, created file %s", output_path)
 
@@ -124,8 +145,7 @@ def inject_template_cli():
 @cli_logging
 def input_to_script_cli():
     """Convert input to script."""
-    ascii_art.print_crown(60)
-    ascii_art.print_banner("QUEENS", 60)
+    print_cli_banner()
 
     parser = argparse.ArgumentParser(
         description="QUEENS cli utils to create python script from input file."
@@ -149,27 +169,28 @@ def input_to_script_cli():
 
     args = sys.argv[1:]
     args = parser.parse_args(args)
-    create_script_from_input_file(args.input, args.output_dir, args.script_path)
+    input_to_script.create_script_from_input_file(args.input, args.output_dir, args.script_path)
 
 
 @cli_logging
 def print_pickle_data_cli():
     """Print pickle data wrapper."""
-    ascii_art.print_crown(60)
-    ascii_art.print_banner("QUEENS", 60)
-    args = sys.argv[1:]
-    if len(args) == 0:
+    print_cli_banner()
+
+    parser = argparse.ArgumentParser(description="QUEENS cli util to print pickled data.")
+    parser.add_argument("file_path", type=Path, nargs="?", help="Path to the pickle file")
+
+    args = parser.parse_args(sys.argv[1:])
+    if args.file_path is None:
         _logger.info("No pickle file was provided!")
     else:
-        file_path = args[0]
-        print_pickled_data(Path(file_path))
+        print_pickled_data(args.file_path)
 
 
 @cli_logging
 def gather_metadata_and_write_to_csv():
     """Gather metadata and write them to csv."""
-    ascii_art.print_crown(60)
-    ascii_art.print_banner("QUEENS", 60)
+    print_cli_banner()
 
     parser = argparse.ArgumentParser(
         description="QUEENS cli util to create csv file for experiment simulation metadata."
@@ -186,7 +207,7 @@ def gather_metadata_and_write_to_csv():
     args = sys.argv[1:]
     args = parser.parse_args(args)
     _logger.info("Gathering metadata and exporting to csv.")
-    write_metadata_to_csv(
+    metadata.write_metadata_to_csv(
         experiment_dir=args.experiment_dir,
         csv_path=args.csv_path,
     )
@@ -18,6 +18,7 @@ The module supplies functions to inject parameter values into a template
 text file.
 """
 
+from functools import lru_cache
 from pathlib import Path
 
 from jinja2 import Environment, StrictUndefined, Undefined
@@ -36,10 +37,23 @@ def render_template(params, template, strict=True):
     Returns:
         str: injected template
     """
+    return _compile_template(template, strict).render(**params)
+
+
+@lru_cache(maxsize=32)
+def _compile_template(template, strict):
+    """Compile a template once and reuse it for all subsequent injections.
+
+    Args:
+        template (str): Template file as string
+        strict (bool): Raises exception if required parameters from the template are missing
+
+    Returns:
+        jinja2.Template: compiled template
+    """
     undefined = StrictUndefined if strict else Undefined
 
-    environment = Environment(undefined=undefined).from_string(template)
-    return environment.render(**params)
+    return Environment(undefined=undefined).from_string(template)
 
 
 def inject_in_template(params, template, output_file, strict=True):
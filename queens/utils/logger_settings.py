@@ -278,28 +278,12 @@ def job_logging(command_string, process, job_logger, terminate_expression):
     Returns:
         stderr (str): Error messages
     """
-    # initialize stderr to None
-    stderr = None
-
     # start logging
     job_logger.info("run_subprocess started with:")
     job_logger.info(command_string)
-    for line in iter(process.stdout.readline, b""):  # b'\n'-separated lines
+    # readline blocks until a line is available and returns "" once stdout is closed
+    for line in iter(process.stdout.readline, ""):  # '\n'-separated lines
         line = line.rstrip()  # remove any trailing whitespaces
-        exit_code = process.poll()
-        if line == "" and exit_code is not None:
-            job_logger.info("subprocess exited with code %s.", exit_code)
-            # This line waits for termination and puts together stdout not yet consumed from the
-            # stream by the logger and finally the stderr.
-            stdout, stderr = process.communicate()
-            # following line should never really do anything. We want to log all that was
-            # written to stdout even after program was terminated.
-            job_logger.info(stdout)
-            if stderr:
-                job_logger.error("error message (if provided) follows:")
-                for errline in io.StringIO(stderr):
-                    job_logger.error(errline)
-            break
         if terminate_expression:
             # two seconds in time.sleep(2) are arbitrary. Feel free to tune it to your needs.
             if re.search(terminate_expression, line):
@@ -317,6 +301,18 @@ def job_logging(command_string, process, job_logger, terminate_expression):
                 continue
         job_logger.info(line)
 
+    # This line waits for termination and puts together stdout not yet consumed from the
+    # stream by the logger and finally the stderr.
+    stdout, stderr = process.communicate()
+    job_logger.info("subprocess exited with code %s.", process.returncode)
+    # following line should never really do anything. We want to log all that was
+    # written to stdout even after program was terminated.
+    job_logger.info(stdout)
+    if stderr:
+        job_logger.error("error message (if provided) follows:")
+        for errline in io.StringIO(stderr):
+            job_logger.error(errline)
+
     return stderr
 
 
@@ -43,13 +43,9 @@ def mh_select(log_acceptance_probability, current_sample, proposed_sample):
         bool_idx (np.array): A boolean array indicating whether each proposed sample was accepted
                              (`True`) or rejected (`False`).
     """
-    isfinite = np.isfinite(log_acceptance_probability)
-    accept = (
-        np.log(np.random.uniform(size=log_acceptance_probability.shape))
-        < log_acceptance_probability
-    )
-
-    bool_idx = isfinite * accept
+    log_uniform = np.log(np.random.uniform(size=log_acceptance_probability.shape))
+    bool_idx = log_uniform < log_acceptance_probability
+    bool_idx &= np.isfinite(log_acceptance_probability)
 
     selected_samples = np.where(bool_idx, proposed_sample, current_sample)
 
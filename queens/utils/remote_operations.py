@@ -18,7 +18,9 @@ import atexit
 import json
 import logging
 import pickle
+import shutil
 import socket
+import tempfile
 import time
 import uuid
 from functools import partial
@@ -30,7 +32,7 @@ from invoke.exceptions import UnexpectedExit
 
 from queens.utils.path_utils import PATH_TO_QUEENS, is_empty
 from queens.utils.rsync import assemble_rsync_command
-from queens.utils.run_subprocess import start_subprocess
+from queens.utils.run_subprocess import run_subprocess, start_subprocess
 
 _logger = logging.getLogger(__name__)
 
@@ -38,6 +40,11 @@ DEFAULT_PACKAGE_MANAGER = "mamba"
 FALLBACK_PACKAGE_MANAGER = "conda"
 SUPPORTED_PACKAGE_MANAGERS = [DEFAULT_PACKAGE_MANAGER, FALLBACK_PACKAGE_MANAGER]
 
+# Reuse one authenticated ssh connection for subsequent ssh calls instead of opening new ones. The
+# control socket lives in a directory owned by the RemoteConnection, so that concurrent QUEENS
+# runs against the same host do not share (and tear down) each other's master connection.
+SSH_MULTIPLEXING_OPTIONS = "-o ControlMaster=auto -o ControlPersist=600"
+
 
 class RemoteConnection(Connection):
     """This is class wrapper around the Connection class of fabric.
@@ -46,6 +53,8 @@ class RemoteConnection(Connection):
         remote_python (str): Path to Python with installed (editable) QUEENS
                             (see remote_queens_repository)
         remote_queens_repository (str, Path): Path to the QUEENS source code on the remote host
+        ssh_control_directory (Path): Temporary directory holding the control socket of the
+                                      multiplexing ssh master of this connection
     """
 
     def __init__(self, host, remote_python, remote_queens_repository, user=None, gateway=None):
@@ -71,11 +80,49 @@ class RemoteConnection(Connection):
         self.remote_queens_repository = remote_queens_repository
         _logger.debug("remote queens repository: %s", self.remote_queens_repository)
 
+        self.ssh_control_directory = None
+
     def open(self):
         """Initiate the SSH connection."""
         super().open()
         atexit.register(self.close)
 
+    def close(self):
+        """Close the SSH connection and stop the multiplexing ssh master."""
+        if self.ssh_control_directory is not None:
+            # the master would otherwise stay alive for the ControlPersist time after QUEENS exits
+            if any(self.ssh_control_directory.iterdir()):
+                control_path = self._ssh_control_path()
+                run_subprocess(
+                    ["ssh", "-o", f"ControlPath={control_path}", "-O", "exit", self._ssh_target()],
+                    raise_error_on_subprocess_failure=False,
+                    allowed_errors=["Exit request sent."],
+                )
+            shutil.rmtree(self.ssh_control_directory, ignore_errors=True)
+            self.ssh_control_directory = None
+        super().close()
+
+    def _ssh_control_path(self):
+        """Get the control path of the multiplexing ssh master of this connection.
+
+        Returns:
+            str: control path, the directory is created on first use
+        """
+        if self.ssh_control_directory is None:
+            self.ssh_control_directory = Path(tempfile.mkdtemp(prefix="queens-ssh-"))
+            atexit.register(self.close)
+        return f"{self.ssh_control_directory}/%C"
+
+    def _ssh_target(self):
+        """Get the host the local ssh commands connect to first.
+
+        Returns:
+            str: user@host of the gateway if one is set, otherwise of the remote host
+        """
+        if self.gateway is not None:
+            return f"{self.gateway.user}@{self.gateway.host}"
+        return f"{self.user}@{self.host}"
+
     def start_cluster(
         self,
         workload_manager,
@@ -186,16 +233,30 @@ class RemoteConnection(Connection):
         if remote_port is None:
             remote_port = self.get_free_remote_port()
 
-        proxyjump = ""
+        ssh_command = ["ssh"]
         if self.gateway is not None:
-            proxyjump = f"-J {self.gateway.user}@{self.gateway.host}:{self.gateway.port}"
-        cmd = (
-            f"ssh {proxyjump} -f -N -L {local_port}:{self.host}:{remote_port} "
-            f"{self.user}@{self.host}"
-        )
+            ssh_command += ["-J", f"{self.gateway.user}@{self.gateway.host}:{self.gateway.port}"]
+        ssh_command += [
+            "-f",
+            "-N",
+            "-o",
+            "ExitOnForwardFailure=yes",
+            # only errors are reported on stderr, which run_subprocess treats as failure
+            "-o",
+            "LogLevel=ERROR",
+            "-L",
+            f"{local_port}:{self.host}:{remote_port}",
+            f"{self.user}@{self.host}",
+        ]
+        # matches the command line of the backgrounded ssh process
+        cmd = " ".join(ssh_command)
         _logger.debug("\nOpening port-forwarding '%s'\n", cmd)
 
-        start_subprocess(cmd)
+        # ssh is run without a shell and returns once it forked into the background
+        run_subprocess(
+            ssh_command,
+            additional_error_message="The port forwarding could not be established.",
+        )
         _logger.debug("Port-forwarding opened successfully.")
 
         kill_cmd = f'pkill -f "{cmd}"'
@@ -243,9 +304,11 @@ class RemoteConnection(Connection):
         if not is_empty(source):
             host = f"{self.user}@{self.host}"
             _logger.debug("Copying from %s to %s", source, destination)
-            remote_shell_command = None
+            remote_shell_command = (
+                f"ssh {SSH_MULTIPLEXING_OPTIONS} -o ControlPath={self._ssh_control_path()}"
+            )
             if self.gateway is not None:
-                remote_shell_command = f"ssh {self.gateway.user}@{self.gateway.host} ssh"
+                remote_shell_command += f" {self._ssh_target()} ssh"
                 _logger.debug("Using remote shell command %s", remote_shell_command)
             rsync_cmd = assemble_rsync_command(
                 source,
@@ -256,7 +319,7 @@ class RemoteConnection(Connection):
                 filters=filters,
                 rsh=remote_shell_command,
                 host=host,
-                rsync_options=["--out-format='%n'", "--checksum"],
+                rsync_options=["--out-format='%n'", "--compress", "--partial"],
             )
             # Run rsync command
             result = self.local(rsync_cmd, in_stream=False)
@@ -332,9 +395,9 @@ def get_port():
     Returns:
         int: free port
     """
-    sock = socket.socket()
-    sock.bind(("", 0))
-    return int(sock.getsockname()[1])
+    with socket.socket() as sock:
+        sock.bind(("", 0))
+        return int(sock.getsockname()[1])
 
 
 VALID_CONNECTION_TYPES = {"remote_connection": RemoteConnection}
@@ -15,6 +15,7 @@
 """Wrapped functions of subprocess stdlib module."""
 
 import logging
+import shlex
 import subprocess
 
 from queens.utils.exceptions import SubprocessError
@@ -36,7 +37,8 @@ def run_subprocess(
 
     return stderr and stdout
     Args:
-        command (str): command, that will be run in subprocess
+        command (str, list): command, that will be run in subprocess. A string is run in a shell,
+                             a list of arguments is executed directly without a shell.
         raise_error_on_subprocess_failure (bool, optional): Raise or warn error defaults to True
         additional_error_message (str, optional): Additional error message to be displayed
         allowed_errors (lst, optional): List of strings to be removed from the error message
@@ -146,7 +148,8 @@ def start_subprocess(command):
     """Start subprocess.
 
     Args:
-        command (str): command, that will be run in subprocess
+        command (str, list): command, that will be run in subprocess. A string is run in a shell,
+                             a list of arguments is executed directly without a shell.
 
     Returns:
          process (subprocess.Popen): subprocess object
@@ -156,7 +159,7 @@ def start_subprocess(command):
         stdin=subprocess.PIPE,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        shell=True,
+        shell=isinstance(command, str),
         universal_newlines=True,
     )
     return process
@@ -173,7 +176,7 @@ def _raise_or_warn_error(
     """Raise or warn eventual exception if subprocess fails.
 
     Args:
-        command (str): Command string
+        command (str, list): Command string or list of arguments
         stdout (str): Command output
         stderr (str): Error of the output
         raise_error_on_subprocess_failure (bool): Raise or warn error defaults to True
@@ -186,6 +189,8 @@ def _raise_or_warn_error(
 
     stderr = _remove_allowed_errors(stderr, allowed_errors)
     if stderr:
+        if not isinstance(command, str):
+            command = shlex.join(command)
         subprocess_error = SubprocessError.construct_error_from_command(
             command, stdout, stderr, additional_error_message
         )
@@ -15,7 +15,6 @@
 """Global fixtures and configurations for integration tests."""
 
 import numpy as np
-import pandas as pd
 import pytest
 
 from queens.example_simulator_functions.gaussian_logpdf import (
@@ -28,24 +27,23 @@ from queens.example_simulator_functions.park91a import park91a_hifi
 from test_utils.integration_tests import get_input_park91a
 
 
-@pytest.fixture(name="_create_experimental_data_gaussian_1d")
-def fixture_create_experimental_data_gaussian_1d(tmp_path):
-    """Create a csv file with experimental data from a 1D Gaussian."""
+@pytest.fixture(name="experimental_data_dir_gaussian_1d", scope="session")
+def fixture_experimental_data_dir_gaussian_1d(tmp_path_factory):
+    """Create a csv file with experimental data from a 1D Gaussian once per session."""
+    # the consuming iterators reseed the random number generator, so the data can be shared
+    tmp_path = tmp_path_factory.mktemp("experimental_data_gaussian_1d")
+
     # generate 10 samples from the same gaussian
     samples = STANDARD_NORMAL.draw(10).flatten()
 
-    # evaluate the gaussian pdf for these 1000 samples
-    pdf = []
-    for sample in samples:
-        pdf.append(gaussian_1d_logpdf(sample))
-
-    pdf = np.array(pdf).flatten()
+    # evaluate the gaussian pdf for all samples at once
+    pdf = gaussian_1d_logpdf(samples).flatten()
 
     # write the data to a csv file in tmp_path
-    data_dict = {"y_obs": pdf}
     experimental_data_path = tmp_path / "experimental_data.csv"
-    dataframe = pd.DataFrame.from_dict(data_dict)
-    dataframe.to_csv(experimental_data_path, index=False)
+    np.savetxt(experimental_data_path, pdf, header="y_obs", comments="")
+
+    return tmp_path
 
 
 @pytest.fixture(name="_create_experimental_data_gaussian_2d")
@@ -55,13 +53,9 @@ def fixture_create_experimental_data_gaussian_2d(tmp_path):
     samples = GAUSSIAN_2D.draw(10)
     pdf = gaussian_2d_logpdf(samples)
 
-    pdf = np.array(pdf)
-
     # write the data to a csv file in tmp_path
-    data_dict = {"y_obs": pdf}
     experimental_data_path = tmp_path / "experimental_data.csv"
-    df = pd.DataFrame.from_dict(data_dict)
-    df.to_csv(experimental_data_path, index=False)
+    np.savetxt(experimental_data_path, pdf, header="y_obs", comments="")
 
 
 @pytest.fixture(name="_create_experimental_data_zero")
@@ -70,10 +64,8 @@ def fixture_create_experimental_data_zero(tmp_path):
     samples = np.array([0, 0]).flatten()
 
     # write the data to a csv file in tmp_path
-    data_dict = {"y_obs": samples}
     experimental_data_path = tmp_path / "experimental_data.csv"
-    dataframe = pd.DataFrame.from_dict(data_dict)
-    dataframe.to_csv(experimental_data_path, index=False)
+    np.savetxt(experimental_data_path, samples, header="y_obs", comments="", fmt="%d")
 
 
 @pytest.fixture(name="training_data_park91a")
@@ -115,7 +107,6 @@ def fixture_target_density_gaussian_1d():
 
     def target_density_gaussian_1d(self, samples):  # pylint: disable=unused-argument
         """Target posterior density."""
-        samples = np.atleast_2d(samples)
         log_likelihood = gaussian_1d_logpdf(samples).reshape(-1, 1)
 
         return log_likelihood
@@ -30,9 +30,8 @@ from queens.utils.io_utils import load_result
 
 
 def test_gaussian_metropolis_hastings(
-    tmp_path,
     target_density_gaussian_1d,
-    _create_experimental_data_gaussian_1d,
+    experimental_data_dir_gaussian_1d,
     global_settings,
 ):
     """Test case for Metropolis Hastings iterator."""
@@ -43,7 +42,7 @@ def test_gaussian_metropolis_hastings(
     # Setup iterator
     experimental_data_reader = ExperimentalDataReader(
         file_name_identifier="*.csv",
-        csv_data_base_dir=tmp_path,
+        csv_data_base_dir=experimental_data_dir_gaussian_1d,
         output_label="y_obs",
     )
     proposal_distribution = NormalDistribution(mean=0.0, covariance=1.0)
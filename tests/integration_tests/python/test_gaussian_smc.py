@@ -18,7 +18,6 @@ This test uses Gaussian likelihood.
 """
 
 import numpy as np
-from mock import patch
 
 from queens.distributions.normal import NormalDistribution
 from queens.drivers.function_driver import FunctionDriver
@@ -34,10 +33,10 @@ from queens.utils.io_utils import load_result
 
 
 def test_gaussian_smc(
-    tmp_path,
     target_density_gaussian_1d,
-    _create_experimental_data_gaussian_1d,
+    experimental_data_dir_gaussian_1d,
     global_settings,
+    monkeypatch,
 ):
     """Test Sequential Monte Carlo with univariate Gaussian."""
     # Parameters
@@ -47,7 +46,7 @@ def test_gaussian_smc(
     # Setup iterator
     experimental_data_reader = ExperimentalDataReader(
         file_name_identifier="*.csv",
-        csv_data_base_dir=tmp_path,
+        csv_data_base_dir=experimental_data_dir_gaussian_1d,
         output_label="y_obs",
     )
     mcmc_proposal_distribution = NormalDistribution(mean=0.0, covariance=1.0)
@@ -75,13 +74,13 @@ def test_gaussian_smc(
 
     # Actual analysis
     # mock methods related to likelihood
-    with patch.object(
+    monkeypatch.setattr(
         SequentialMonteCarloIterator, "eval_log_likelihood", target_density_gaussian_1d
-    ):
-        with patch.object(
-            MetropolisHastingsIterator, "eval_log_likelihood", target_density_gaussian_1d
-        ):
-            run_iterator(iterator, global_settings=global_settings)
+    )
+    monkeypatch.setattr(
+        MetropolisHastingsIterator, "eval_log_likelihood", target_density_gaussian_1d
+    )
+    run_iterator(iterator, global_settings=global_settings)
 
     # Load results
     results = load_result(global_settings.result_file(".pickle"))
@@ -33,9 +33,8 @@ from queens.utils.io_utils import load_result
 
 
 def test_gaussian_smc_chopin_adaptive_tempering(
-    tmp_path,
     target_density_gaussian_1d,
-    _create_experimental_data_gaussian_1d,
+    experimental_data_dir_gaussian_1d,
     global_settings,
 ):
     """Test Sequential Monte Carlo with univariate Gaussian."""
@@ -46,7 +45,7 @@ def test_gaussian_smc_chopin_adaptive_tempering(
     # Setup iterator
     experimental_data_reader = ExperimentalDataReader(
         file_name_identifier="*.csv",
-        csv_data_base_dir=tmp_path,
+        csv_data_base_dir=experimental_data_dir_gaussian_1d,
         output_label="y_obs",
     )
     driver = FunctionDriver(parameters=parameters, function="patch_for_likelihood")
@@ -79,13 +79,13 @@ def test_metropolis_hastings_multiple_chains_multivariate_gaussian(
 
     # Actual analysis
     # mock methods related to likelihood
-    with patch.object(
-        SequentialMonteCarloIterator, "eval_log_likelihood", target_density_gaussian_2d
+    with (
+        patch.object(
+            SequentialMonteCarloIterator, "eval_log_likelihood", target_density_gaussian_2d
+        ),
+        patch.object(MetropolisHastingsIterator, "eval_log_likelihood", target_density_gaussian_2d),
     ):
-        with patch.object(
-            MetropolisHastingsIterator, "eval_log_likelihood", target_density_gaussian_2d
-        ):
-            run_iterator(iterator, global_settings=global_settings)
+        run_iterator(iterator, global_settings=global_settings)
 
     # Load results
     results = load_result(global_settings.result_file(".pickle"))
@@ -91,9 +91,11 @@ def test_smc_bayes_temper_multivariate_gaussian_mixture(
 
     # Actual analysis
     # mock methods related to likelihood
-    with patch.object(SequentialMonteCarloIterator, "eval_log_likelihood", target_density):
-        with patch.object(MetropolisHastingsIterator, "eval_log_likelihood", target_density):
-            run_iterator(iterator, global_settings=global_settings)
+    with (
+        patch.object(SequentialMonteCarloIterator, "eval_log_likelihood", target_density),
+        patch.object(MetropolisHastingsIterator, "eval_log_likelihood", target_density),
+    ):
+        run_iterator(iterator, global_settings=global_settings)
 
     # Load results
     results = load_result(global_settings.result_file(".pickle"))
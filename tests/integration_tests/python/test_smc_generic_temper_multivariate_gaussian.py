@@ -86,9 +86,11 @@ def test_smc_generic_temper_multivariate_gaussian(
     )
 
     # Actual analysis
-    with patch.object(SequentialMonteCarloIterator, "eval_log_likelihood", target_density):
-        with patch.object(MetropolisHastingsIterator, "eval_log_likelihood", target_density):
-            run_iterator(iterator, global_settings=global_settings)
+    with (
+        patch.object(SequentialMonteCarloIterator, "eval_log_likelihood", target_density),
+        patch.object(MetropolisHastingsIterator, "eval_log_likelihood", target_density),
+    ):
+        run_iterator(iterator, global_settings=global_settings)
 
     # Load results
     results = load_result(global_settings.result_file(".pickle"))
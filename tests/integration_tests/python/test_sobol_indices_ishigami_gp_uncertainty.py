@@ -18,6 +18,7 @@ This test uses metamodel uncertainty.
 """
 
 import numpy as np
+import pytest
 
 from queens.distributions.uniform import UniformDistribution
 from queens.drivers.function_driver import FunctionDriver
@@ -31,14 +32,17 @@ from queens.schedulers.pool_scheduler import PoolScheduler
 from queens.utils.io_utils import load_result
 
 
-def test_sobol_indices_ishigami_gp_uncertainty(global_settings):
-    """Test case for Sobol indices based on GP realizations."""
-    # Parameters
+@pytest.fixture(name="parameters")
+def fixture_parameters():
+    """Parameters of the Ishigami function."""
     x1 = UniformDistribution(lower_bound=-3.14159265359, upper_bound=3.14159265359)
     x2 = UniformDistribution(lower_bound=-3.14159265359, upper_bound=3.14159265359)
     x3 = UniformDistribution(lower_bound=-3.14159265359, upper_bound=3.14159265359)
-    parameters = Parameters(x1=x1, x2=x2, x3=x3)
+    return Parameters(x1=x1, x2=x2, x3=x3)
+
 
+def test_sobol_indices_ishigami_gp_uncertainty(global_settings, parameters):
+    """Test case for Sobol indices based on GP realizations."""
     # Setup iterator
     driver = FunctionDriver(parameters=parameters, function="ishigami90")
     scheduler = PoolScheduler(experiment_name=global_settings.experiment_name)
@@ -118,14 +122,8 @@ def test_sobol_indices_ishigami_gp_uncertainty(global_settings):
     np.testing.assert_allclose(results["total_order"].values, expected_st, atol=1e-05)
 
 
-def test_sobol_indices_ishigami_gp_uncertainty_third_order(global_settings):
+def test_sobol_indices_ishigami_gp_uncertainty_third_order(global_settings, parameters):
     """Test case for third-order Sobol indices."""
-    # Parameters
-    x1 = UniformDistribution(lower_bound=-3.14159265359, upper_bound=3.14159265359)
-    x2 = UniformDistribution(lower_bound=-3.14159265359, upper_bound=3.14159265359)
-    x3 = UniformDistribution(lower_bound=-3.14159265359, upper_bound=3.14159265359)
-    parameters = Parameters(x1=x1, x2=x2, x3=x3)
-
     # Setup iterator
     driver = FunctionDriver(parameters=parameters, function="ishigami90")
     scheduler = PoolScheduler(experiment_name=global_settings.experiment_name)
@@ -186,14 +184,8 @@ def test_sobol_indices_ishigami_gp_uncertainty_third_order(global_settings):
     np.testing.assert_allclose(results["third_order"].values, expected_s3, atol=1e-05)
 
 
-def test_sobol_indices_ishigami_gp_mean(global_settings):
+def test_sobol_indices_ishigami_gp_mean(global_settings, parameters):
     """Test case for Sobol indices based on GP mean."""
-    # Parameters
-    x1 = UniformDistribution(lower_bound=-3.14159265359, upper_bound=3.14159265359)
-    x2 = UniformDistribution(lower_bound=-3.14159265359, upper_bound=3.14159265359)
-    x3 = UniformDistribution(lower_bound=-3.14159265359, upper_bound=3.14159265359)
-    parameters = Parameters(x1=x1, x2=x2, x3=x3)
-
     # Setup iterator
     driver = FunctionDriver(parameters=parameters, function="ishigami90")
     scheduler = PoolScheduler(experiment_name=global_settings.experiment_name)
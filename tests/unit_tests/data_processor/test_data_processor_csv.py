@@ -282,6 +282,26 @@ def test_get_raw_data_from_file_without_index(dummy_csv_file, default_data_proce
     pd.testing.assert_frame_equal(raw_data, expected_raw_data)
 
 
+def test_get_raw_data_from_comma_separated_file(
+    dummy_csv_file, default_data_processor, default_raw_data, tmp_path
+):
+    """Test get raw data from file with comma separated columns."""
+    with open(dummy_csv_file, encoding="utf-8") as csv_file:
+        lines = csv_file.read().splitlines()
+    comma_csv_file = tmp_path / "comma_csvfile.csv"
+    with open(comma_csv_file, "w", encoding="utf-8") as csv_file:
+        csv_file.write("\n".join(lines[:4] + [",".join(line.split()) for line in lines[4:]]))
+
+    default_data_processor.header_row = 0
+    default_data_processor.use_cols_lst = [1, 3]
+    default_data_processor.skip_rows = 3
+    default_data_processor.index_column = 0
+
+    raw_data = default_data_processor.get_raw_data_from_file(comma_csv_file)
+
+    pd.testing.assert_frame_equal(raw_data, default_raw_data)
+
+
 def test_filter_entire_file(default_data_processor, default_raw_data):
     """Test filter entire file."""
     default_data_processor.filter_type = "entire_file"
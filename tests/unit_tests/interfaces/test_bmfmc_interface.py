@@ -121,3 +121,20 @@ def test_build_approximation(mocker, default_interface):
     default_interface.build_approximation(Z, Y)
     mp1.assert_called_once()
     mp2.assert_called_once()
+
+
+def test_build_approximation_skips_retraining(mocker, default_interface):
+    """Test that training on identical data is only performed once."""
+    Z = np.atleast_2d(np.linspace(0.0, 1.0, 10))
+    Y = np.atleast_2d(np.linspace(1.0, 2.0, 10))
+    mp1 = mocker.patch.object(FakeRegression, "setup")
+    mp2 = mocker.patch.object(FakeRegression, "train")
+
+    default_interface.build_approximation(Z, Y)
+    default_interface.build_approximation(Z.copy(), Y.copy())
+    assert mp1.call_count == 1
+    assert mp2.call_count == 1
+
+    default_interface.build_approximation(Z, 2 * Y)
+    assert mp1.call_count == 2
+    assert mp2.call_count == 2
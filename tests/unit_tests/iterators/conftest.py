@@ -25,14 +25,14 @@ from queens.distributions.uniform import UniformDistribution
 from queens.drivers.function_driver import FunctionDriver
 from queens.models.simulation_model import SimulationModel
 from queens.parameters.parameters import Parameters
-from queens.schedulers.local_scheduler import LocalScheduler
+from queens.schedulers.pool_scheduler import PoolScheduler
 
 
 @pytest.fixture(name="default_simulation_model")
 def fixture_default_simulation_model():
     """Default simulation model."""
     driver = FunctionDriver(parameters=Mock(), function="ishigami90")
-    scheduler = LocalScheduler(experiment_name="dummy_experiment_name")
+    scheduler = PoolScheduler(experiment_name="dummy_experiment_name", verbose=False)
     model = SimulationModel(scheduler=scheduler, driver=driver)
     return model
 
@@ -77,3 +77,28 @@ def test_correct_results(default_lhs_iterator, ref_result_iterator):
     np.testing.assert_allclose(
         default_lhs_iterator.output["result"][0:10], ref_result_iterator, 1e-09, 1e-09
     )
+
+
+@pytest.mark.parametrize("criterion", ["random-cd", "lloyd"])
+def test_scipy_sampling_seeded(default_lhs_iterator, criterion):
+    """Test that the scipy criteria are reproducible with the seed."""
+    default_lhs_iterator.criterion = criterion
+    default_lhs_iterator.pre_run()
+    samples = default_lhs_iterator.samples
+    default_lhs_iterator.pre_run()
+
+    assert samples.shape == (default_lhs_iterator.num_samples, 3)
+    np.testing.assert_array_equal(default_lhs_iterator.samples, samples)
+
+
+def test_scipy_sampling_random_cd(default_lhs_iterator):
+    """Test that the random-cd criterion keeps the latin hypercube property."""
+    default_lhs_iterator.criterion = "random-cd"
+    default_lhs_iterator.pre_run()
+
+    # each of the equally probable intervals of the uniform x1 holds exactly one sample
+    num_samples = default_lhs_iterator.num_samples
+    unit_samples = (default_lhs_iterator.samples[:, 0] + 3.14159265359) / (2 * 3.14159265359)
+    np.testing.assert_array_equal(
+        np.sort(np.floor(unit_samples * num_samples)), np.arange(num_samples)
+    )
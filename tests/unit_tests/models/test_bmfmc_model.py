@@ -17,6 +17,7 @@
 import numpy as np
 import pytest
 from mock import Mock, patch
+from sklearn.preprocessing import StandardScaler
 
 from queens.distributions.uniform import UniformDistribution
 from queens.iterators.data_iterator import DataIterator
@@ -297,8 +298,8 @@ def test_load_sampling_data(mocker, default_bmfmc_model, default_data_iterator,
     # run the current method
     default_bmfmc_model.load_sampling_data()
 
-    # tests min amount of data iterator calls
-    assert mp1.call_count >= 6
+    # tests that every data file is read exactly once
+    assert mp1.call_count == 3
 
     # test assembling of multiple LF data
     np.testing.assert_array_almost_equal(
@@ -429,16 +430,16 @@ def test_calculate_p_yhf_var(mocker, default_bmfmc_model):
 
     expected_var = np.array(
         [
-            -0.0580733,
-            -0.00377325,
-            0.00100094,
-            0.001509,
-            0.00200187,
-            0.00251098,
-            0.00299406,
-            0.00341733,
-            0.00376561,
-            0.00404483,
+            -0.0580869187,
+            -0.0038386264,
+            0.000863014,
+            0.0012936698,
+            0.0017343579,
+            0.0022536386,
+            0.0028380136,
+            0.0034556447,
+            0.0040549236,
+            0.0045714771,
         ]
     )
     # asserts / tests
@@ -446,10 +447,50 @@ def test_calculate_p_yhf_var(mocker, default_bmfmc_model):
     np.testing.assert_array_almost_equal(default_bmfmc_model.p_yhf_var, expected_var, decimal=8)
 
 
+def test_calculate_p_yhf_var_subsampled(mocker, default_bmfmc_model):
+    """Test that the subsampled HF density variance approximates the full one."""
+    num_samples = 200
+    mocker.patch(
+        "queens.interfaces.bmfmc_interface.BmfmcInterface.evaluate",
+        return_value=(None, 0.01 * np.eye(num_samples)),
+    )
+    rng = np.random.default_rng(0)
+    default_bmfmc_model.var_y_mc = np.ones((num_samples, 1))
+    default_bmfmc_model.y_pdf_support = np.linspace(-1.0, 1.0, 10)
+    default_bmfmc_model.m_f_mc = rng.normal(size=(num_samples, 1))
+    default_bmfmc_model.p_yhf_mean = np.zeros(10)
+
+    default_bmfmc_model.calculate_p_yhf_var()
+    full_var = default_bmfmc_model.p_yhf_var
+
+    default_bmfmc_model.pair_subsample_fraction = 0.5
+    default_bmfmc_model.calculate_p_yhf_var()
+    subsampled_var = default_bmfmc_model.p_yhf_var
+
+    np.testing.assert_allclose(subsampled_var, full_var, rtol=0.1)
+
+    # the subsample is reproducible for a fixed seed
+    default_bmfmc_model.calculate_p_yhf_var()
+    np.testing.assert_array_equal(default_bmfmc_model.p_yhf_var, subsampled_var)
+
+
+def test_calculate_p_yhf_var_single_point(mocker, default_bmfmc_model):
+    """Test that the HF density variance requires at least two points."""
+    mocker.patch(
+        "queens.interfaces.bmfmc_interface.BmfmcInterface.evaluate",
+        return_value=(None, np.ones((1, 1))),
+    )
+    default_bmfmc_model.var_y_mc = np.ones((1, 1))
+    default_bmfmc_model.m_f_mc = np.zeros((1, 1))
+
+    with pytest.raises(ValueError, match="at least two Monte-Carlo points"):
+        default_bmfmc_model.calculate_p_yhf_var()
+
+
 def test_compute_pymc_reference(mocker, default_bmfmc_model):
     """Test computation of reference kernel density estimate."""
     mp1 = mocker.patch("queens.utils.pdf_estimation.estimate_bandwidth_for_kde", return_value=1.0)
-    mp2 = mocker.patch("queens.utils.pdf_estimation.estimate_pdf", return_value=(1.0, None))
+    mp2 = mocker.patch("queens.utils.pdf_estimation.estimate_pdf_fft", return_value=(1.0, None))
 
     default_bmfmc_model.Y_LFs_train = np.array([[1.0, 1.0]])
     default_bmfmc_model.compute_pymc_reference()
@@ -520,11 +561,9 @@ def test_calculate_extended_gammas(mocker, default_bmfmc_model):
         "queens.visualization.bmfmc_visualization.bmfmc_visualization_instance"
         ".plot_feature_ranking"
     )
-    mp3 = mocker.patch(
-        "queens.models.bmfmc_model.StandardScaler.fit_transform", return_value=y_LFS_mc_stdized
-    )
+    mp3 = mocker.patch("queens.models.bmfmc_model.standardize", return_value=y_LFS_mc_stdized)
 
-    def linear_scale_dummy(a, b):  # pylint: disable=unused-argument
+    def linear_scale_dummy(a, b, **_kwargs):  # pylint: disable=unused-argument
         return a
 
     with patch.object(bmfmc_model, "linear_scale_a_to_b", linear_scale_dummy):
@@ -648,6 +687,26 @@ def test_linear_scale_a_to_b():
     scaled_a_vec = bmfmc_model.linear_scale_a_to_b(a_vec, b_vec)
     np.testing.assert_array_almost_equal(scaled_a_vec, expected_scaled_a_vec, decimal=6)
 
+    # scale each column individually
+    a_mat = np.vstack((a_vec, 2.0 * a_vec + 1.0)).T
+    expected_scaled_a_mat = np.vstack((expected_scaled_a_vec, expected_scaled_a_vec)).T
+    scaled_a_mat = bmfmc_model.linear_scale_a_to_b(a_mat, b_vec, axis=0)
+    np.testing.assert_array_almost_equal(scaled_a_mat, expected_scaled_a_mat, decimal=6)
+
+
+def test_standardize():
+    """Test column-wise standardization."""
+    np.random.seed(1)
+    data = np.hstack((np.random.random((20, 2)), np.ones((20, 1))))
+    expected_data_stdizd = StandardScaler().fit_transform(data)
+
+    data_stdizd = bmfmc_model.standardize(data)
+    np.testing.assert_array_almost_equal(data_stdizd, expected_data_stdizd, decimal=12)
+
+    data_stdizd = bmfmc_model.standardize(data, dtype=np.float32)
+    assert data_stdizd.dtype == np.float32
+    np.testing.assert_array_almost_equal(data_stdizd, expected_data_stdizd, decimal=6)
+
 
 def test_assemble_x_red_stdizd():
     """Test assembling and standardization of the dimension-reduced input."""
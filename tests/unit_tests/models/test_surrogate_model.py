@@ -0,0 +1,83 @@
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (c) 2024, QUEENS contributors.
+#
+# This file is part of QUEENS.
+#
+# QUEENS is free software: you can redistribute it and/or modify it under the terms of the GNU
+# Lesser General Public License as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version. QUEENS is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more details. You
+# should have received a copy of the GNU Lesser General Public License along with QUEENS. If not,
+# see <https://www.gnu.org/licenses/>.
+#
+"""Test-module for abstract SurrogateModel class."""
+
+import numpy as np
+import pytest
+
+from queens.models.surrogate_models.surrogate_model import SurrogateModel
+from queens.utils.exceptions import InvalidOptionError
+
+
+@pytest.fixture(name="y_test")
+def fixture_y_test():
+    """Output values of the test data set."""
+    return np.array([[1.0], [2.0], [3.0], [4.0]])
+
+
+@pytest.fixture(name="y_posterior_mean")
+def fixture_y_posterior_mean():
+    """Predicted output values."""
+    return np.array([[1.5], [2.0], [2.0], [4.0]])
+
+
+def test_compute_error_measures(y_test, y_posterior_mean):
+    """Test computation of the error measures."""
+    measures = [
+        "sum_squared",
+        "mean_squared",
+        "root_mean_squared",
+        "sum_abs",
+        "mean_abs",
+        "abs_max",
+        "nash_sutcliffe_efficiency",
+    ]
+    expected_error_measures = {
+        "sum_squared": 1.25,
+        "mean_squared": 0.3125,
+        "root_mean_squared": np.sqrt(0.3125),
+        "sum_abs": 1.5,
+        "mean_abs": 0.375,
+        "abs_max": 1.0,
+        "nash_sutcliffe_efficiency": 0.75,
+    }
+
+    error_measures = SurrogateModel.compute_error_measures(y_test, y_posterior_mean, measures)
+
+    assert error_measures.keys() == expected_error_measures.keys()
+    for measure, expected_error in expected_error_measures.items():
+        np.testing.assert_almost_equal(error_measures[measure], expected_error)
+        np.testing.assert_almost_equal(
+            SurrogateModel.compute_error(y_test, y_posterior_mean, measure), expected_error
+        )
+
+
+def test_compute_error_measures_invalid(y_test, y_posterior_mean):
+    """Test that an unknown error measure raises an error."""
+    with pytest.raises(InvalidOptionError):
+        SurrogateModel.compute_error_measures(y_test, y_posterior_mean, ["unknown_measure"])
+
+
+def test_compute_error_measures_nan():
+    """Test that NaN entries propagate to the error measures."""
+    y_test = np.array([1.0, np.nan, 3.0])
+    y_posterior_mean = np.array([1.0, 2.0, 0.0])
+
+    error_measures = SurrogateModel.compute_error_measures(
+        y_test, y_posterior_mean, ["sum_squared", "sum_abs", "abs_max"]
+    )
+
+    for error in error_measures.values():
+        assert np.isnan(error)
@@ -14,8 +14,6 @@
 #
 """Test-module for Random field expansions."""
 
-from unittest.mock import MagicMock
-
 import numpy as np
 import pytest
 
@@ -25,117 +23,6 @@ from queens.parameters.parameters import from_config_create_parameters
 @pytest.fixture(name="parameters", scope="module")
 def fixture_parameters(pre_processor):
     """Parameters dict with random fields."""
-    # mock np.linalg.eigh function
-    np.linalg.eigh = MagicMock(
-        return_value=(
-            np.array(
-                [
-                    0.45871872,
-                    0.33733471,
-                    0.33733471,
-                    0.24807078,
-                    0.21987822,
-                    0.21987822,
-                    0.16169507,
-                    0.16169507,
-                ]
-            ),
-            np.array(
-                [
-                    [
-                        -2.51370339e-01,
-                        4.93708941e-01,
-                        8.73030401e-02,
-                        5.00000000e-01,
-                        2.75230174e-02,
-                        3.52475145e-01,
-                        -4.98562964e-01,
-                        8.03936995e-03,
-                    ],
-                    [
-                        -3.53548079e-01,
-                        4.08591703e-01,
-                        -2.85801471e-01,
-                        -5.39814040e-16,
-                        -4.98695975e-01,
-                        3.61916477e-02,
-                        3.60190899e-01,
-                        3.48759022e-01,
-                    ],
-                    [
-                        -2.51370339e-01,
-                        8.73030401e-02,
-                        -4.93708941e-01,
-                        -5.00000000e-01,
-                        2.75230174e-02,
-                        3.52475145e-01,
-                        -8.03936995e-03,
-                        -4.98562964e-01,
-                    ],
-                    [
-                        -3.53548079e-01,
-                        2.85801471e-01,
-                        4.08591703e-01,
-                        2.61003557e-16,
-                        4.98269263e-01,
-                        -4.16563707e-02,
-                        3.48759022e-01,
-                        -3.60190899e-01,
-                    ],
-                    [
-                        -4.97259321e-01,
-                        -2.40914807e-16,
-                        -3.22497934e-16,
-                        -2.12697105e-15,
-                        -5.50460347e-02,
-                        -7.04950290e-01,
-                        5.19638692e-16,
-                        5.08102538e-16,
-                    ],
-                    [
-                        -3.53548079e-01,
-                        -2.85801471e-01,
-                        -4.08591703e-01,
-                        -1.06257318e-15,
-                        4.98269263e-01,
-                        -4.16563707e-02,
-                        -3.48759022e-01,
-                        3.60190899e-01,
-                    ],
-                    [
-                        -2.51370339e-01,
-                        -8.73030401e-02,
-                        4.93708941e-01,
-                        -5.00000000e-01,
-                        2.75230174e-02,
-                        3.52475145e-01,
-                        8.03936995e-03,
-                        4.98562964e-01,
-                    ],
-                    [
-                        -3.53548079e-01,
-                        -4.08591703e-01,
-                        2.85801471e-01,
-                        1.30916575e-16,
-                        -4.98695975e-01,
-                        3.61916477e-02,
-                        -3.60190899e-01,
-                        -3.48759022e-01,
-                    ],
-                    [
-                        -2.51370339e-01,
-                        -4.93708941e-01,
-                        -8.73030401e-02,
-                        5.00000000e-01,
-                        2.75230174e-02,
-                        3.52475145e-01,
-                        4.98562964e-01,
-                        -8.03936995e-03,
-                    ],
-                ]
-            ),
-        )
-    )
     parameters_dict = {
         "field_1": {"type": "kl", "corr_length": 0.3, "std": 0.5, "explained_variance": 0.9},
         "field_2": {
@@ -294,20 +181,17 @@ def test_sample_as_dict(parameters):
     """Test *sample_as_dict* method."""
     sample = np.ones(shape=(1, 29))
     sample_dict = parameters.sample_as_dict(sample)
+    sample_values = np.array(list(sample_dict.values()))
 
+    # the KL eigenbasis is only unique up to sign and rotation, so the expansion is not pinned
+    kl_field = parameters.dict["field_1"]
+    np.testing.assert_almost_equal(
+        sample_values[:9], kl_field.expanded_representation(np.ones(shape=(1, 8)))[0]
+    )
     np.testing.assert_almost_equal(
-        np.array(list(sample_dict.values())),
+        sample_values[9:],
         np.array(
             [
-                0.39717782125387063,
-                -0.09993212915495203,
-                -0.6808521625113999,
-                0.37336763150663344,
-                -0.6931588544685283,
-                -0.42405291800614264,
-                0.1986562065280319,
-                -0.8127228669345008,
-                0.11676031012249019,
                 0.34550880227254777,
                 0.3882699167000142,
                 0.24364631605094017,
@@ -331,6 +215,22 @@ def test_sample_as_dict(parameters):
     )
 
 
+def test_kl_field_eigendecomposition(parameters):
+    """Test the truncated eigendecomposition of the KL field against a full one."""
+    kl_field = parameters.dict["field_1"]
+    eigenvalues, eigenvectors = np.linalg.eigh(kl_field.cov_matrix)
+    leading_eigenvalues = eigenvalues[-kl_field.dimension :]
+    leading_eigenvectors = eigenvectors[:, -kl_field.dimension :]
+
+    np.testing.assert_allclose(kl_field.eigenvalues, np.flip(leading_eigenvalues))
+    # the truncated covariance is invariant to the sign and rotation of the eigenvectors
+    np.testing.assert_allclose(
+        kl_field.eigenbasis @ kl_field.eigenbasis.T,
+        leading_eigenvectors * leading_eigenvalues @ leading_eigenvectors.T,
+        atol=1e-12,
+    )
+
+
 def test_to_list(parameters):
     """Test *to_list* method."""
     parameters_list = parameters.to_list()
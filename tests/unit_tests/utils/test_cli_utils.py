@@ -14,11 +14,12 @@
 #
 """Tests for cli utils."""
 
+import sys
 from pathlib import Path
 
 import pytest
 
-from queens.utils.cli_utils import get_cli_options
+from queens.utils.cli_utils import get_cli_options, print_cli_banner
 from queens.utils.exceptions import CLIError
 
 
@@ -58,3 +59,16 @@ def test_get_cli_options_debug(debug_flag):
     assert input_file == Path("input_file")
     assert output_dir == Path("output_dir")
     assert debug == debug_flag
+
+
+@pytest.mark.parametrize("isatty", [True, False])
+def test_print_cli_banner(mocker, monkeypatch, isatty):
+    """Test that the ascii art is only printed to a terminal."""
+    monkeypatch.setattr(sys.stdout, "isatty", lambda: isatty)
+    print_crown = mocker.patch("queens.utils.ascii_art.print_crown")
+    print_banner = mocker.patch("queens.utils.ascii_art.print_banner")
+
+    print_cli_banner()
+
+    assert print_crown.called == isatty
+    assert print_banner.called == isatty
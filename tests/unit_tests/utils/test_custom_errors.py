@@ -46,3 +46,9 @@ def test_subprocess_raises_error():
     """Check if non existing command raises an SubprocessError."""
     with pytest.raises(SubprocessError):
         run_subprocess("NonExistingCommand")
+
+
+def test_subprocess_argument_list_raises_error():
+    """Check if a failing command given as argument list raises an SubprocessError."""
+    with pytest.raises(SubprocessError, match="ls NonExistingFile"):
+        run_subprocess(["ls", "NonExistingFile"])
@@ -17,6 +17,8 @@
 @author: Sebastian Brandstaeter
 """
 
+import math
+
 import numpy as np
 import pytest
 
@@ -38,9 +40,7 @@ def fixture_num_chains():
 @pytest.fixture(name="log_acceptance_probability", scope="module")
 def fixture_log_acceptance_probability(acceptance_probability, num_chains):
     """Possible natural logarithm of acceptance probability."""
-    acceptance_probability = np.array([[acceptance_probability]] * num_chains)
-    log_acceptance_probability = np.log(acceptance_probability)
-    return log_acceptance_probability
+    return np.full((num_chains, 1), math.log(acceptance_probability))
 
 
 @pytest.fixture(name="current_sample", scope="module")
@@ -80,8 +80,7 @@ def test_mh_select(
 
 def test_mh_select_accept_prob_1(current_sample, proposed_sample, num_chains):
     r"""Test MH acceptance when acceptance probability is >= 1."""
-    acceptance_probability = np.ones((num_chains, 1))
-    log_acceptance_probability = np.log(acceptance_probability)
+    log_acceptance_probability = np.zeros((num_chains, 1))
     selected_sample, accepted = mh_select(
         log_acceptance_probability, current_sample, proposed_sample
     )
@@ -92,8 +91,7 @@ def test_mh_select_accept_prob_1(current_sample, proposed_sample, num_chains):
 
 def test_mh_select_accept_prob_0(current_sample, proposed_sample, num_chains):
     """Test rejection of proposal based on acceptance probability = 0.0."""
-    acceptance_probability = np.zeros((num_chains, 1))
-    log_acceptance_probability = np.log(acceptance_probability)
+    log_acceptance_probability = np.full((num_chains, 1), -np.inf)
     selected_sample, accepted = mh_select(
         log_acceptance_probability, current_sample, proposed_sample
     )
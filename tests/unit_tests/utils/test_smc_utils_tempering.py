@@ -44,16 +44,12 @@ def fixture_temper_parameter(request):
     return request.param
 
 
-@pytest.fixture(name="logpdf0", scope="module", params=[-np.inf, -1e8, 0.0, 1e10])
-def fixture_logpdf0(request):
-    """Return a valid logpdf."""
-    return request.param
-
-
-@pytest.fixture(name="logpdf1", scope="module", params=[-np.inf, -1e8, 0.0, 1e10])
-def fixture_logpdf1(request):
-    """Return a valid logpdf."""
-    return request.param
+@pytest.fixture(name="logpdfs", scope="module")
+def fixture_logpdfs():
+    """Return all combinations of valid logpdfs as two flat arrays."""
+    valid_logpdfs = np.array([-np.inf, -1e8, 0.0, 1e10])
+    logpdf0, logpdf1 = np.meshgrid(valid_logpdfs, valid_logpdfs, indexing="ij")
+    return logpdf0.ravel(), logpdf1.ravel()
 
 
 def test_temper_factory(temper_keyword_and_temper_type):
@@ -71,27 +67,31 @@ def test_temper_factory_invalid():
         smc_utils.temper_factory(temper)
 
 
-def test_temper_logpdf_bayes(logpdf0, logpdf1, temper_parameter):
+def test_temper_logpdf_bayes(logpdfs, temper_parameter):
     """Test the bayesian tempering function."""
-    sum1 = temper_parameter * logpdf1
+    logpdf0, logpdf1 = logpdfs
     if math.isclose(temper_parameter, 0.0, abs_tol=1e-8):
         sum1 = 0.0
+    else:
+        sum1 = temper_parameter * logpdf1
 
     tempered_logpdf_sol = sum1 + logpdf0
     tempered_logpdf = smc_utils.temper_logpdf_bayes(logpdf0, logpdf1, temper_parameter)
-    assert np.isclose(tempered_logpdf, tempered_logpdf_sol)
+    assert np.allclose(tempered_logpdf, tempered_logpdf_sol)
 
 
-def test_temper_logpdf_bayes_posinf_invalid(logpdf0, temper_parameter):
+def test_temper_logpdf_bayes_posinf_invalid(logpdfs, temper_parameter):
     """Test the bayesian tempering function is invalid for infinity."""
+    logpdf, _ = logpdfs
     with pytest.raises(ValueError):
-        smc_utils.temper_logpdf_bayes(np.inf, logpdf0, temper_parameter)
+        smc_utils.temper_logpdf_bayes(np.inf, logpdf, temper_parameter)
     with pytest.raises(ValueError):
-        smc_utils.temper_logpdf_bayes(logpdf0, np.inf, temper_parameter)
+        smc_utils.temper_logpdf_bayes(logpdf, np.inf, temper_parameter)
 
 
-def test_temper_logpdf_generic(logpdf0, logpdf1, temper_parameter):
+def test_temper_logpdf_generic(logpdfs, temper_parameter):
     """Test the generic tempering function."""
+    logpdf0, logpdf1 = logpdfs
     if math.isclose(temper_parameter, 0.0, abs_tol=1e-8):
         tempered_logpdf_sol = logpdf0
     elif math.isclose(temper_parameter, 1.0):
@@ -100,12 +100,13 @@ def test_temper_logpdf_generic(logpdf0, logpdf1, temper_parameter):
         tempered_logpdf_sol = temper_parameter * logpdf1 + (1.0 - temper_parameter) * logpdf0
 
     tempered_logpdf = smc_utils.temper_logpdf_generic(logpdf0, logpdf1, temper_parameter)
-    assert np.isclose(tempered_logpdf, tempered_logpdf_sol)
+    assert np.allclose(tempered_logpdf, tempered_logpdf_sol)
 
 
-def test_temper_logpdf_generic_posinf_invalid(logpdf0, temper_parameter):
+def test_temper_logpdf_generic_posinf_invalid(logpdfs, temper_parameter):
     """Test the generic tempering function is invalid for infinity."""
+    logpdf, _ = logpdfs
     with pytest.raises(ValueError):
-        smc_utils.temper_logpdf_generic(np.inf, logpdf0, temper_parameter)
+        smc_utils.temper_logpdf_generic(np.inf, logpdf, temper_parameter)
     with pytest.raises(ValueError):
-        smc_utils.temper_logpdf_generic(logpdf0, np.inf, temper_parameter)
+        smc_utils.temper_logpdf_generic(logpdf, np.inf, temper_parameter)
@@ -22,7 +22,11 @@ import unittest
 import numpy as np
 import pytest
 
-from queens.utils.pdf_estimation import estimate_bandwidth_for_kde, estimate_pdf
+from queens.utils.pdf_estimation import (
+    estimate_bandwidth_for_kde,
+    estimate_pdf,
+    estimate_pdf_fft,
+)
 
 
 class TestPDFEstimation(unittest.TestCase):
@@ -71,3 +75,27 @@ class TestPDFEstimation(unittest.TestCase):
 
         np.testing.assert_almost_equal(pdf_estimate[50], 0.40575231779015242, 7)
         np.testing.assert_almost_equal(supp_points[50], -0.36114748358535964, 7)
+
+    def test_density_estimation_fft(self):
+        """Test FFT-based density estimation against the direct estimation."""
+        supp_points = np.linspace(-1, 1, 10)
+        pdf_estimate, _ = estimate_pdf_fft(self.samples, self.bandwidth, support_points=supp_points)
+        pdf_desired, _ = estimate_pdf(self.samples, self.bandwidth, support_points=supp_points)
+
+        np.testing.assert_allclose(pdf_estimate, pdf_desired, rtol=1e-4)
+
+    def test_density_estimation_fft_narrow_kernel(self):
+        """Test FFT-based density estimation for kernels narrower than the default grid."""
+        supp_points = np.linspace(-1, 1, 10)
+        samples = np.random.randn(2000)
+        pdf_estimate, _ = estimate_pdf_fft(samples, 0.005, support_points=supp_points)
+        pdf_desired, _ = estimate_pdf(samples, 0.005, support_points=supp_points)
+
+        np.testing.assert_allclose(pdf_estimate, pdf_desired, rtol=5e-3)
+
+        # a resolving grid would be more expensive than the direct estimation
+        samples = np.append(self.samples, 1e4)
+        pdf_estimate, _ = estimate_pdf_fft(samples, self.bandwidth, support_points=supp_points)
+        pdf_desired, _ = estimate_pdf(samples, self.bandwidth, support_points=supp_points)
+
+        np.testing.assert_allclose(pdf_estimate, pdf_desired)